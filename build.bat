@@ -30,7 +30,7 @@ REM If that fails, try the simple build
 if %ERRORLEVEL% neq 0 (
     echo.
     echo ⚠️ Main build failed, trying simple build method...
-    python build-simple.py
+    python build.py --mode simple
 )
 
 REM Check if executable was created
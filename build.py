@@ -1,134 +1,145 @@
 #!/usr/bin/env python3
-"""Build script for creating FatherTime executable."""
+"""Build script for creating FatherTime executable.
 
+Usage:
+    python build.py                  # spec build for the current platform
+    python build.py --mode windows   # build from build-windows.spec
+    python build.py --mode spec      # build from build.spec
+    python build.py --mode simple    # plain PyInstaller command, no spec file
+"""
+
+import argparse
 import os
 import shutil
 import subprocess
 import sys
+from collections import deque
 from pathlib import Path
 
 
+# Spec template copied to build-windows.spec when that file is missing
+WINDOWS_SPEC_TEMPLATE = Path(__file__).with_name("build-windows.spec.tmpl")
+
+# Number of trailing PyInstaller output lines repeated on failure
+OUTPUT_TAIL_LINES = 200
+
+# Directories never searched for stale .pyc files: VCS metadata and virtual
+# environments hold thousands of entries and none of the project's bytecode
+PYC_PURGE_SKIP_DIRS = frozenset({".git", ".hg", "venv", ".venv", "node_modules"})
+
+# Trees at least this large are removed with the platform's native tool
+NATIVE_RMTREE_THRESHOLD = 1000
+
+
+def _count_entries(path, limit):
+    """Count entries below path, stopping once limit is reached."""
+    count = 0
+    pending = [path]
+    while pending and count < limit:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                count += 1
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+    return count
+
+
+def remove_tree(path):
+    """Remove a directory tree, shelling out to rm/rmdir for large trees."""
+    if _count_entries(path, NATIVE_RMTREE_THRESHOLD) >= NATIVE_RMTREE_THRESHOLD:
+        if sys.platform.startswith('win'):
+            cmd = ["cmd", "/c", "rmdir", "/S", "/Q", path]
+        elif shutil.which("rm"):
+            cmd = ["rm", "-rf", "--", path]
+        else:
+            cmd = None
+
+        if cmd:
+            subprocess.run(cmd, check=False, close_fds=False)
+            if not os.path.exists(path):
+                return
+
+    # Small tree, or the native tool was unavailable/failed
+    shutil.rmtree(path)
+
+
 def clean_build_dirs():
     """Clean previous build artifacts."""
     dirs_to_clean = ["build", "dist", "__pycache__"]
     for dir_name in dirs_to_clean:
         if os.path.exists(dir_name):
             print(f"Cleaning {dir_name}/")
-            shutil.rmtree(dir_name)
+            remove_tree(dir_name)
     
     # Clean .pyc files
-    for root, dirs, files in os.walk("."):
-        for file in files:
-            if file.endswith(".pyc"):
-                os.remove(os.path.join(root, file))
+    _purge_pyc(".")
+
+
+def _purge_pyc(path):
+    """Recursively delete .pyc files below path.
+
+    Where supported, files are unlinked relative to a held directory fd so
+    the kernel does not re-resolve the full path for every file.
+
+    Directories that cannot be read and files that cannot be removed are
+    reported and skipped, so one bad entry never aborts the clean.
+    """
+    dir_fd = None
+    try:
+        if os.unlink in os.supports_dir_fd:
+            dir_fd = os.open(path, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in PYC_PURGE_SKIP_DIRS:
+                            _purge_pyc(entry.path)
+                    elif entry.name.endswith(".pyc"):
+                        if dir_fd is not None:
+                            os.unlink(entry.name, dir_fd=dir_fd)
+                        else:
+                            os.unlink(entry.path)
+                except OSError as e:
+                    print(f"⚠️  Could not remove {entry.path}: {e}")
+    except OSError as e:
+        print(f"⚠️  Skipping unreadable directory {path}: {e}")
+    finally:
+        if dir_fd is not None:
+            os.close(dir_fd)
 
 
 def create_windows_spec():
     """Create Windows-specific spec file if it doesn't exist."""
-    spec_content = '''# -*- mode: python ; coding: utf-8 -*-
+    shutil.copyfile(WINDOWS_SPEC_TEMPLATE, "build-windows.spec")
+    print("✅ Created build-windows.spec")
 
-import os
-from pathlib import Path
 
-# Get project root directory (current working directory when PyInstaller runs)
-project_root = Path('.')
-
-block_cipher = None
-
-a = Analysis(
-    ['main.py'],
-    pathex=[str(project_root)],
-    binaries=[],
-    datas=[
-        # Include QML files
-        ('ui/*.qml', 'ui'),
-        # Include data directory structure (but not actual data files - they'll be created at runtime)
-        ('data', 'data'),
-        # Include configuration files
-        ('src/config', 'src/config'),
-    ],
-    hiddenimports=[
-        # PySide6 core modules
-        'PySide6.QtCore',
-        'PySide6.QtGui', 
-        'PySide6.QtQml',
-        'PySide6.QtQuick',
-        'PySide6.QtQuickControls2',
-        # Windows-specific Qt platform plugins
-        'PySide6.plugins.platforms.qwindows',
-        'PySide6.plugins.platforms.qminimal',
-        # Application modules
-        'src.fathertime.config',
-        'src.fathertime.config_manager',
-        'src.fathertime.database',
-        'src.fathertime.exceptions',
-        'src.fathertime.logger',
-        'src.fathertime.timer_manager',
-    ],
-    hookspath=[],
-    hooksconfig={},
-    runtime_hooks=[],
-    excludes=[
-        'tkinter',
-        'matplotlib',
-        'numpy',
-        'pandas',
-        'scipy',
-        'PIL',
-        'jupyter',
-        'IPython',
-        'test',
-        'tests',
-        # Exclude Linux-specific Qt plugins
-        'PySide6.plugins.platforms.qxcb',
-        'PySide6.plugins.platforms.qcocoa',
-    ],
-    win_no_prefer_redirects=False,
-    win_private_assemblies=False,
-    cipher=block_cipher,
-    noarchive=False,
-)
-
-pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
-
-exe = EXE(
-    pyz,
-    a.scripts,
-    a.binaries,
-    a.zipfiles,
-    a.datas,
-    [],
-    name='FatherTime',
-    debug=False,
-    bootloader_ignore_signals=False,
-    strip=False,
-    upx=True,
-    upx_exclude=[],
-    runtime_tmpdir=None,
-    console=False,  # Set to True for debugging
-    disable_windowed_traceback=False,
-    target_arch=None,
-    codesign_identity=None,
-    entitlements_file=None,
-    icon=None,  # Add path to .ico file if you have one
-    version=None,
-)
-'''
-    
-    with open("build-windows.spec", "w") as f:
-        f.write(spec_content)
-    print("✅ Created build-windows.spec")
+def run_streaming(cmd):
+    """Run cmd, echoing its combined output line by line as it arrives.
 
+    Returns:
+        Tuple of (return code, deque holding the last OUTPUT_TAIL_LINES lines)
+    """
+    tail = deque(maxlen=OUTPUT_TAIL_LINES)
+    # close_fds=False lets CPython launch via posix_spawn instead of fork+exec
+    with subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1,
+        close_fds=False,
+    ) as process:
+        for line in process.stdout:
+            sys.stdout.write(line)
+            tail.append(line)
+        returncode = process.wait()
+    return returncode, tail
 
-def build_executable():
-    """Build the executable using PyInstaller."""
-    print("Building FatherTime executable...")
-    
-    # Ensure data directory exists (PyInstaller needs it to exist)
-    Path("data").mkdir(exist_ok=True)
-    
-    # Choose the right spec file based on platform
-    if sys.platform.startswith('win'):
+
+def spec_command(mode):
+    """Get the PyInstaller command for a spec-file build, or None on error."""
+    if mode == "windows":
         spec_file = "build-windows.spec"
         print("🪟 Using Windows-optimized build configuration")
         # Create Windows spec if it doesn't exist
@@ -146,20 +157,61 @@ def build_executable():
         for f in os.listdir("."):
             if f.endswith(".spec"):
                 print(f"  - {f}")
-        return False
+        return None
     
     # Run PyInstaller with absolute path to spec file
     spec_path = os.path.abspath(spec_file)
-    cmd = [
+    return [
         sys.executable, "-m", "PyInstaller",
         "--clean",
         "--noconfirm", 
         spec_path
     ]
+
+
+def simple_command():
+    """Get the PyInstaller command for a build without a spec file."""
+    print("Using simple build method (no spec file)")
+    return [
+        sys.executable, "-m", "PyInstaller",
+        "--onefile",
+        "--windowed",
+        "--name=FatherTime",
+        "--add-data=ui;ui",
+        "--add-data=data;data", 
+        "--add-data=src/config;src/config",
+        # Application and PySide6 modules imported from Python are found by
+        # PyInstaller's static analysis; QtQuick is only reached from QML
+        "--hidden-import=PySide6.QtQuick",
+        "--exclude-module=tkinter",
+        "--exclude-module=matplotlib",
+        "--exclude-module=numpy",
+        "--exclude-module=pandas",
+        "--exclude-module=scipy",
+        "--exclude-module=PIL",
+        "--exclude-module=jupyter",
+        "--exclude-module=IPython",
+        "--clean",
+        "--noconfirm",
+        "main.py"
+    ]
+
+
+def build_executable(mode):
+    """Build the executable using PyInstaller."""
+    print("Building FatherTime executable...")
     
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    # Ensure data directory exists (PyInstaller needs it to exist)
+    Path("data").mkdir(exist_ok=True)
     
-    if result.returncode == 0:
+    cmd = simple_command() if mode == "simple" else spec_command(mode)
+    if cmd is None:
+        return False
+    
+    print("Running PyInstaller...")
+    returncode, output_tail = run_streaming(cmd)
+    
+    if returncode == 0:
         print("✅ Build successful!")
         print("📁 Executable created in dist/")
         if os.path.exists("dist/FatherTime.exe"):
@@ -168,15 +220,29 @@ def build_executable():
             print("🎉 Executable: dist/FatherTime")
     else:
         print("❌ Build failed!")
-        print("STDOUT:", result.stdout)
-        print("STDERR:", result.stderr)
+        print(f"Last {len(output_tail)} lines of PyInstaller output:")
+        print("".join(output_tail), end="")
         return False
     
     return True
 
 
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Build the FatherTime executable.")
+    parser.add_argument(
+        "--mode",
+        choices=("spec", "windows", "simple"),
+        default="windows" if sys.platform.startswith('win') else "spec",
+        help="build from build.spec, build-windows.spec, or without a spec file "
+        "(default: the spec for the current platform)",
+    )
+    return parser.parse_args()
+
+
 def main():
     """Main build process."""
+    args = parse_args()
     print("🔨 Starting FatherTime build process...")
     
     # Check if PyInstaller is available
@@ -185,13 +251,16 @@ def main():
         print(f"✅ PyInstaller {PyInstaller.__version__} found")
     except ImportError:
         print("❌ PyInstaller not found. Installing...")
-        subprocess.run([sys.executable, "-m", "pip", "install", "pyinstaller>=5.0.0"])
+        subprocess.run(
+            [sys.executable, "-m", "pip", "install", "pyinstaller>=5.0.0"],
+            close_fds=False,
+        )
     
     # Clean previous builds
     clean_build_dirs()
     
     # Build executable
-    if build_executable():
+    if build_executable(args.mode):
         print("\n🎊 Build completed successfully!")
         print("📦 You can find your executable in the dist/ directory")
     else:
@@ -1,46 +1,54 @@
 #!/usr/bin/env python3
 """Main entry point for Father Time application."""
 
+import logging
 import os
 import sys
-from pathlib import Path
-
-from PySide6.QtCore import QUrl
-from PySide6.QtGui import QGuiApplication
-from PySide6.QtQml import QQmlApplicationEngine
-from PySide6.QtQuickControls2 import QQuickStyle
+from typing import TYPE_CHECKING
 
 from src.fathertime.config import APP_NAME, QT_ENVIRONMENT
-from src.fathertime.config_manager import ConfigManager
 from src.fathertime.exceptions import FatherTimeError
 from src.fathertime.logger import logger
-from src.fathertime.timer_manager import TimerManager
-from src.fathertime.theme_manager import ThemeManager
+
+# Qt modules are imported lazily inside the functions that need them so the
+# module-level import path stays stdlib-only and the Qt environment variables
+# are in place before QtCore is first loaded.
+if TYPE_CHECKING:
+    from PySide6.QtGui import QGuiApplication
+    from PySide6.QtQml import QQmlApplicationEngine
+
+# Bundled resources live under sys._MEIPASS in a PyInstaller build
+BASE_DIR = getattr(sys, "_MEIPASS", os.path.dirname(os.path.abspath(__file__)))
+QML_FILE = os.path.join(BASE_DIR, "ui", "main.qml")
 
 
 def setup_qt_environment() -> None:
     """Configure Qt environment variables."""
-    for key, value in QT_ENVIRONMENT.items():
-        os.environ[key] = value
-        logger.debug(f"Set {key}={value}")
+    os.environ.update(QT_ENVIRONMENT)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Qt environment: %s", dict(QT_ENVIRONMENT))
 
 
-def create_application() -> QGuiApplication:
+def create_application() -> "QGuiApplication":
     """Create and configure Qt application."""
+    from PySide6.QtGui import QGuiApplication
+    from PySide6.QtQuickControls2 import QQuickStyle
+
     app = QGuiApplication(sys.argv)
     QQuickStyle.setStyle("Basic")
     app.setApplicationName(APP_NAME)
     return app
 
 
-def load_qml(engine: QQmlApplicationEngine) -> bool:
+def load_qml(engine: "QQmlApplicationEngine") -> bool:
     """Load QML file and return success status."""
-    qml_file = Path(__file__).parent / "ui" / "main.qml"
-    if not qml_file.exists():
-        logger.error(f"QML file not found: {qml_file}")
+    from PySide6.QtCore import QUrl
+
+    if not os.path.isfile(QML_FILE):
+        logger.error(f"QML file not found: {QML_FILE}")
         return False
 
-    engine.load(QUrl.fromLocalFile(str(qml_file)))
+    engine.load(QUrl.fromLocalFile(QML_FILE))
 
     if not engine.rootObjects():
         logger.error("Failed to load QML file - no root objects created")
@@ -62,6 +70,12 @@ def main() -> int:
         app = create_application()
 
         # Create QML engine and managers
+        from PySide6.QtQml import QQmlApplicationEngine
+
+        from src.fathertime.config_manager import ConfigManager
+        from src.fathertime.theme_manager import ThemeManager
+        from src.fathertime.timer_manager import TimerManager
+
         engine = QQmlApplicationEngine()
 
         try:
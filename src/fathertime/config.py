@@ -2,59 +2,67 @@
 
 import os
 import sys
-from typing import Dict
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Final, Mapping
 
 # Application constants
-APP_NAME = "Father Time"
-DEFAULT_WINDOW_WIDTH = 800
-DEFAULT_WINDOW_HEIGHT = 600
+APP_NAME: Final = "Father Time"
+DEFAULT_WINDOW_WIDTH: Final = 800
+DEFAULT_WINDOW_HEIGHT: Final = 600
 
 # File paths (relative to project root)
-DEFAULT_DB_FILE = "data/timers.json"
-DEFAULT_SESSIONS_FILE = "data/sessions.json"
-DEFAULT_STATS_FILE = "data/stats.json"
-DEFAULT_CONFIG_FILE = "src/config/config.json"
-ARCHIVE_DIRECTORY = "data/archive"
+DEFAULT_DB_FILE: Final = "data/timers.json"
+DEFAULT_SESSIONS_FILE: Final = "data/sessions.json"
+DEFAULT_STATS_FILE: Final = "data/stats.json"
+DEFAULT_CONFIG_FILE: Final = "src/config/config.json"
+ARCHIVE_DIRECTORY: Final = "data/archive"
 
 # Timer update intervals (milliseconds)
-TIMER_UPDATE_INTERVAL = 1000  # 1 second
-DAY_CHECK_INTERVAL = 60000  # 1 minute
-BREAKDOWN_UPDATE_INTERVAL = 5000  # 5 seconds
-BATCH_SAVE_INTERVAL = 10000  # 10 seconds
+TIMER_UPDATE_INTERVAL: Final = 1000  # 1 second
+DAY_CHECK_INTERVAL: Final = 60000  # 1 minute
+BREAKDOWN_UPDATE_INTERVAL: Final = 5000  # 5 seconds
+BATCH_SAVE_INTERVAL: Final = 10000  # 10 seconds
+CONFIG_SAVE_DELAY: Final = 500  # Debounce for config writes
+
+# Write the config file indented for hand editing; compact by default
+CONFIG_PRETTY: Final = bool(os.environ.get("FATHERTIME_CONFIG_PRETTY"))
 
 # Archive settings
-ARCHIVE_DAYS_THRESHOLD = 14  # Archive data older than 2 weeks
+ARCHIVE_DAYS_THRESHOLD: Final = 14  # Archive data older than 2 weeks
+
+# Platform checks (sys.platform is fixed for the life of the process)
+_IS_WINDOWS = sys.platform == "win32"
+_IS_MACOS = sys.platform == "darwin"
+
 
 # Qt environment settings - platform specific
-def get_qt_environment() -> Dict[str, str]:
-    """Get Qt environment settings based on the current platform."""
-    if sys.platform.startswith('win'):
+@lru_cache(maxsize=None)
+def get_qt_environment() -> Mapping[str, str]:
+    """Get Qt environment settings based on the current platform.
+
+    The result is computed once and returned as a read-only mapping.
+    """
+    if _IS_WINDOWS:
         # Windows settings
-        return {
-            "QT_QPA_PLATFORM": "windows",
-            "QT_QUICK_BACKEND": "software",
-            "QSG_RHI_BACKEND": "software",
-        }
-    elif sys.platform.startswith('darwin'):
+        platform = "windows"
+    elif _IS_MACOS:
         # macOS settings
-        return {
-            "QT_QPA_PLATFORM": "cocoa",
-            "QT_QUICK_BACKEND": "software",
-            "QSG_RHI_BACKEND": "software",
-        }
+        platform = "cocoa"
     else:
         # Linux/Unix settings
-        return {
-            "QT_QPA_PLATFORM": "xcb",
-            "QT_QUICK_BACKEND": "software",
-            "QSG_RHI_BACKEND": "software",
-        }
+        platform = "xcb"
+    return MappingProxyType({
+        "QT_QPA_PLATFORM": platform,
+        "QT_QUICK_BACKEND": "software",
+        "QSG_RHI_BACKEND": "software",
+    })
 
-# Default Qt environment for backwards compatibility
-QT_ENVIRONMENT: Dict[str, str] = get_qt_environment()
+# Default Qt environment for backwards compatibility (read-only)
+QT_ENVIRONMENT: Mapping[str, str] = get_qt_environment()
 
-# Default color scheme
-DEFAULT_COLORS: Dict[str, str] = {
+# Default color scheme (read-only; copy it before making changes)
+DEFAULT_COLORS: Mapping[str, str] = MappingProxyType({
     "primary": "#2c3e50",
     "secondary": "#34495e",
     "accent": "#3498db",
@@ -65,7 +73,7 @@ DEFAULT_COLORS: Dict[str, str] = {
     "text": "#2c3e50",
     "cardBackground": "#ffffff",
     "cardBorder": "#e0e0e0",
-}
+})
 
 
 def get_data_dir() -> str:
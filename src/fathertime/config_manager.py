@@ -1,16 +1,88 @@
 """Configuration management for Father Time application."""
 
 import json
-import os
+import re
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, FrozenSet, Optional, Tuple
 
-from PySide6.QtCore import Property, QObject, Signal, Slot
+from PySide6.QtCore import Property, QCoreApplication, QObject, QTimer, Signal, Slot
 
-from .config import DEFAULT_COLORS, DEFAULT_CONFIG_FILE
+from .config import (
+    CONFIG_PRETTY,
+    CONFIG_SAVE_DELAY,
+    DEFAULT_COLORS,
+    DEFAULT_CONFIG_FILE,
+)
 from .exceptions import ConfigError
+from .fileio import write_private_file
 from .logger import logger
 
+# Use orjson for faster (de)serialization when available
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Serializer options. OPT_NON_STR_KEYS matches json's coercion of non-string
+# keys; the config is only indented when CONFIG_PRETTY is set.
+if HAS_ORJSON:
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | (
+        orjson.OPT_INDENT_2 if CONFIG_PRETTY else 0
+    )
+_JSON_FORMAT = {"indent": 2} if CONFIG_PRETTY else {"separators": (",", ":")}
+
+# Known color keys, for cheap membership checks
+_COLOR_KEYS = frozenset(DEFAULT_COLORS)
+
+# Attributes populated from the config file on first access
+_LOADED_ATTRS = frozenset(
+    {
+        "_config_data",
+        "_colors",
+        "_calendar_view",
+        "_window_width",
+        "_window_height",
+        "_time_rounding_enabled",
+        "_time_rounding_minutes",
+    }
+)
+
+# Path validation: banned characters (".." is checked separately), system
+# directories and accepted config file extensions
+_DIR_BANNED_CHARS = frozenset("~$")
+_FILE_BANNED_CHARS = frozenset("~$|;&\\")
+_SENSITIVE_DIRS = ("/etc", "/root", "/var/log", "/usr", "/bin", "/sbin")
+_CONFIG_EXTENSIONS = (".json", ".conf", ".cfg")
+
+# Accepted values for the validated setters
+_ROUNDING_MINUTES = frozenset({15, 30, 60})
+_CALENDAR_VIEWS = frozenset({"month", "week"})
+_WINDOW_WIDTHS = range(800, 3841)
+_WINDOW_HEIGHTS = range(600, 2161)
+
+# Matches "#" followed by exactly six hex digits
+_HEX_COLOR_MATCH = re.compile(r"#[0-9a-fA-F]{6}\Z").match
+
+
+@lru_cache(maxsize=64)
+def _split_key(key: str) -> Tuple[str, ...]:
+    """Split a dot-notation config key, caching the result."""
+    return tuple(key.split("."))
+
+
+@lru_cache(maxsize=None)
+def _sensitive_roots() -> FrozenSet[Path]:
+    """Get the restricted system directories, both as written and resolved.
+
+    Resolving matters where they are symlinks (e.g. /etc -> /private/etc on
+    macOS), since data directories are compared after resolution.
+    """
+    roots = {Path(d) for d in _SENSITIVE_DIRS}
+    return frozenset(roots | {root.resolve() for root in roots})
+
 
 class ConfigManager(QObject):
     """Manages application configuration including color themes."""
@@ -20,6 +92,9 @@ class ConfigManager(QObject):
     calendarViewChanged = Signal()
     windowSizeChanged = Signal()
 
+    # Class-level default so __getattr__ never recurses before __init__ runs
+    _loaded = False
+
     def __init__(
         self, config_file: Optional[str] = None, data_dir: Optional[str] = None
     ):
@@ -38,25 +113,65 @@ class ConfigManager(QObject):
             config_file or DEFAULT_CONFIG_FILE
         )
 
+        # The config file is read on first use of any loaded attribute (see
+        # __getattr__) rather than here
+        self._loaded = False
+
+        # Coalesce bursts of setter calls into one write. Without a running
+        # application there is no event loop to fire the timer, so changes
+        # are written immediately instead.
+        self._dirty = False
+        app = QCoreApplication.instance()
+        if app is not None:
+            self._save_timer = QTimer(self)
+            self._save_timer.setSingleShot(True)
+            self._save_timer.setInterval(CONFIG_SAVE_DELAY)
+            self._save_timer.timeout.connect(self.flush_pending_save)
+            app.aboutToQuit.connect(self.flush_pending_save)
+        else:
+            self._save_timer = None
+
+    def __getattr__(self, name: str) -> Any:
+        """Load the config on first access to an attribute it provides.
+
+        Only called when normal lookup fails, so once loaded these
+        attributes are plain instance attributes with no extra cost.
+        """
+        if not self._loaded and (name in _LOADED_ATTRS or name.startswith("_c_")):
+            self._ensure_loaded()
+            return getattr(self, name)
+        raise AttributeError(
+            f"{type(self).__name__!r} object has no attribute {name!r}"
+        )
+
+    def _ensure_loaded(self) -> None:
+        """Load the config file and derived attributes if not done yet."""
+        if self._loaded:
+            return
+        self._loaded = True
         try:
             self._config_data = self._load_config()
-            self._colors = self._config_data.get("colors", DEFAULT_COLORS.copy())
+            self._colors = self._config_data.get("colors", DEFAULT_COLORS)
             self._calendar_view = self._config_data.get("calendar_view", "month")
             self._window_width = self._config_data.get("window_width", 1200)
             self._window_height = self._config_data.get("window_height", 700)
+            self._cache_colors()
+            self._cache_time_rounding()
             logger.info(f"Config loaded from {self.config_file}")
         except Exception as e:
             logger.error(f"Failed to load config: {e}")
             self._config_data = {
-                "colors": DEFAULT_COLORS.copy(), 
+                "colors": DEFAULT_COLORS,
                 "calendar_view": "month",
                 "window_width": 1200,
                 "window_height": 700
             }
-            self._colors = DEFAULT_COLORS.copy()
+            self._colors = DEFAULT_COLORS
             self._calendar_view = "month"
             self._window_width = 1200
             self._window_height = 700
+            self._cache_colors()
+            self._cache_time_rounding()
             logger.info("Using default colors, calendar view, and window size")
 
     def _validate_and_resolve_path(self, data_dir: Optional[str]) -> Path:
@@ -84,15 +199,16 @@ class ConfigManager(QObject):
         path_str = str(path)
         
         # Check for path traversal attempts
-        dangerous_components = ['..', '~', '$']
-        if any(component in data_dir for component in dangerous_components):
+        if ".." in data_dir or not _DIR_BANNED_CHARS.isdisjoint(data_dir):
             raise ConfigError(
                 f"Directory path '{data_dir}' contains dangerous components"
             )
             
         # Ensure path is not pointing to sensitive system directories
-        sensitive_paths = ['/etc', '/root', '/var/log', '/usr', '/bin', '/sbin']
-        if any(path_str.startswith(sensitive) for sensitive in sensitive_paths):
+        # path is already resolved, so symlinks into these directories are
+        # caught; compare whole components so /usrdata is not mistaken for /usr
+        sensitive = _sensitive_roots()
+        if path in sensitive or not sensitive.isdisjoint(path.parents):
             raise ConfigError(
                 f"Directory path '{data_dir}' points to restricted system directory"
             )
@@ -119,8 +235,7 @@ class ConfigManager(QObject):
             raise ConfigError("Config file name cannot be empty")
             
         # Security checks for filename - allow forward slashes for relative paths but block dangerous patterns
-        dangerous_patterns = ['..', '~', '$', '|', ';', '&', '\\']
-        if any(pattern in config_file for pattern in dangerous_patterns):
+        if ".." in config_file or not _FILE_BANNED_CHARS.isdisjoint(config_file):
             raise ConfigError(
                 f"Config file name '{config_file}' contains invalid characters"
             )
@@ -132,8 +247,7 @@ class ConfigManager(QObject):
             )
             
         # Check file extension
-        allowed_extensions = ['.json', '.conf', '.cfg']
-        if not any(config_file.endswith(ext) for ext in allowed_extensions):
+        if not config_file.endswith(_CONFIG_EXTENSIONS):
             config_file += '.json'  # Default to JSON if no extension
             
         # Ensure filename length is reasonable
@@ -151,18 +265,23 @@ class ConfigManager(QObject):
         Raises:
             ConfigError: If config cannot be loaded or is invalid
         """
-        default_config = {"colors": DEFAULT_COLORS}
-        
-        if not self.config_file.exists():
+        # Open directly rather than stat-then-open; a missing file is the
+        # rare first-run case
+        try:
+            raw = self.config_file.read_bytes()
+        except FileNotFoundError:
             logger.info(
                 f"Config file {self.config_file} does not exist, creating default"
             )
+            default_config = {"colors": DEFAULT_COLORS}
             self._save_config(default_config)
             return default_config
+        except IOError as e:
+            logger.error(f"Cannot read config file: {e}")
+            raise ConfigError(f"Cannot read config file: {e}") from e
 
         try:
-            with open(self.config_file, "r", encoding="utf-8") as f:
-                config = json.load(f)
+            config = orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
 
             if not isinstance(config, dict):
                 raise ConfigError("Config file must contain a JSON object")
@@ -170,25 +289,24 @@ class ConfigManager(QObject):
             colors = config.get("colors", {})
             if not isinstance(colors, dict):
                 logger.warning("Invalid colors section in config, using defaults")
-                colors = DEFAULT_COLORS.copy()
-            else:
-                # Merge with defaults to ensure all required colors exist
-                merged_colors = DEFAULT_COLORS.copy()
-                merged_colors.update(colors)
-                colors = merged_colors
+                colors = {}
 
-            # Validate color values
-            self._validate_colors(colors)
-            config["colors"] = colors
+            # Validate only user overrides; the defaults are known-good
+            self._validate_colors(
+                {k: v for k, v in colors.items() if DEFAULT_COLORS.get(k) != v}
+            )
+
+            # Merge with defaults to ensure all required colors exist; with
+            # no overrides the shared defaults are used until first write
+            config["colors"] = (
+                {**DEFAULT_COLORS, **colors} if colors else DEFAULT_COLORS
+            )
 
             return config
 
         except json.JSONDecodeError as e:
             logger.error(f"Invalid JSON in config file: {e}")
             raise ConfigError(f"Invalid JSON in config file: {e}") from e
-        except IOError as e:
-            logger.error(f"Cannot read config file: {e}")
-            raise ConfigError(f"Cannot read config file: {e}") from e
 
     def _save_config(self, config: Dict[str, Any]) -> None:
         """Save configuration to file.
@@ -200,17 +318,41 @@ class ConfigManager(QObject):
             ConfigError: If config cannot be saved
         """
         try:
-            self.config_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.config_file, "w", encoding="utf-8") as f:
-                json.dump(config, f, indent=2, ensure_ascii=False)
-            
-            # Set secure file permissions (owner read/write only)
-            self.config_file.chmod(0o600)
+            # default=dict serializes the read-only DEFAULT_COLORS mapping
+            if HAS_ORJSON:
+                payload = orjson.dumps(config, default=dict, option=_ORJSON_OPTIONS)
+            else:
+                payload = json.dumps(
+                    config, default=dict, ensure_ascii=False, **_JSON_FORMAT
+                ).encode("utf-8")
+
+            # Config saves are debounced and rare, so each one is synced
+            write_private_file(self.config_file, payload, durable=True)
             logger.debug(f"Config saved to {self.config_file}")
         except IOError as e:
             logger.error(f"Error saving config: {e}")
             raise ConfigError(f"Cannot save config: {e}") from e
 
+    def _schedule_save(self) -> None:
+        """Mark the config as changed and (re)start the debounced save."""
+        if self._save_timer is None:
+            self._save_config(self._config_data)
+            return
+        self._dirty = True
+        self._save_timer.start()
+
+    def flush_pending_save(self) -> None:
+        """Write any pending config changes now (used on shutdown)."""
+        if self._save_timer is not None:
+            self._save_timer.stop()
+        if self._dirty:
+            self._dirty = False
+            try:
+                self._save_config(self._config_data)
+            except ConfigError:
+                # Already logged; retry on the next change or flush
+                self._dirty = True
+
     def _validate_colors(self, colors: Dict[str, str]) -> None:
         """Validate color values are valid hex colors.
 
@@ -221,75 +363,74 @@ class ConfigManager(QObject):
             ConfigError: If any color value is invalid
         """
         for key, value in colors.items():
-            if not isinstance(value, str):
-                raise ConfigError(f"Color {key} must be a string, got {type(value)}")
-            if not value.startswith("#") or len(value) != 7:
-                raise ConfigError(
-                    f"Color {key} must be a valid hex color "
-                    f"(e.g., #ff0000), got {value}"
-                )
-            try:
-                int(value[1:], 16)
-            except ValueError:
-                raise ConfigError(
-                    f"Color {key} contains invalid hex characters: {value}"
-                )
-
-    @Property(str, notify=colorsChanged)
-    def primary(self) -> str:
-        """Get primary color."""
-        return self._colors.get("primary", DEFAULT_COLORS["primary"])
-
-    @Property(str, notify=colorsChanged)
-    def secondary(self) -> str:
-        """Get secondary color."""
-        return self._colors.get("secondary", DEFAULT_COLORS["secondary"])
-
-    @Property(str, notify=colorsChanged)
-    def accent(self) -> str:
-        """Get accent color."""
-        return self._colors.get("accent", DEFAULT_COLORS["accent"])
-
-    @Property(str, notify=colorsChanged)
-    def success(self) -> str:
-        """Get success color."""
-        return self._colors.get("success", DEFAULT_COLORS["success"])
-
-    @Property(str, notify=colorsChanged)
-    def danger(self) -> str:
-        """Get danger color."""
-        return self._colors.get("danger", DEFAULT_COLORS["danger"])
-
-    @Property(str, notify=colorsChanged)
-    def warning(self) -> str:
-        """Get warning color."""
-        return self._colors.get("warning", DEFAULT_COLORS["warning"])
-
-    @Property(str, notify=colorsChanged)
-    def background(self) -> str:
-        """Get background color."""
-        return self._colors.get("background", DEFAULT_COLORS["background"])
-
-    @Property(str, notify=colorsChanged)
-    def text(self) -> str:
-        """Get text color."""
-        return self._colors.get("text", DEFAULT_COLORS["text"])
-
-    @Property(str, notify=colorsChanged)
-    def cardBackground(self) -> str:
-        """Get card background color."""
-        return self._colors.get("cardBackground", DEFAULT_COLORS["cardBackground"])
-
-    @Property(str, notify=colorsChanged)
-    def cardBorder(self) -> str:
-        """Get card border color."""
-        return self._colors.get("cardBorder", DEFAULT_COLORS["cardBorder"])
+            self._validate_color(key, value)
+
+    def _validate_color(self, key: str, value: str) -> None:
+        """Validate a single color value is a valid hex color.
+
+        Args:
+            key: Color key, used in error messages
+            value: Color value to validate
+
+        Raises:
+            ConfigError: If the color value is invalid
+        """
+        if not isinstance(value, str):
+            raise ConfigError(f"Color {key} must be a string, got {type(value)}")
+        if not _HEX_COLOR_MATCH(value):
+            raise ConfigError(
+                f"Color {key} must be a valid hex color "
+                f"(e.g., #ff0000), got {value}"
+            )
+
+    def _own_colors(self) -> Dict[str, str]:
+        """Return a mutable colors dict, copying the shared defaults on first write."""
+        if self._colors is DEFAULT_COLORS:
+            self._colors = dict(DEFAULT_COLORS)
+            self._config_data["colors"] = self._colors
+        return self._colors
+
+    def _cache_colors(self) -> None:
+        """Mirror the colors dict into per-key attributes read by the getters.
+
+        _load_config merges over DEFAULT_COLORS, so every default key is
+        present and needs no fallback.
+        """
+        colors = self._colors
+        for key in DEFAULT_COLORS:
+            setattr(self, f"_c_{key}", colors[key])
+
+    def _cache_time_rounding(self) -> None:
+        """Mirror the time rounding settings read by their getters."""
+        self._time_rounding_enabled = self.get_value("timeRounding.enabled", True)
+        self._time_rounding_minutes = self.get_value(
+            "timeRounding.roundingMinutes", 15
+        )
+
+    # One read-only Property per DEFAULT_COLORS key (primary, secondary, ...).
+    # attrgetter keeps each read a single C-level attribute load of the value
+    # mirrored by _cache_colors.
+    for _key in DEFAULT_COLORS:
+        locals()[_key] = Property(
+            str,
+            attrgetter(f"_c_{_key}"),
+            notify=colorsChanged,
+            doc=f"Get {_key} color.",
+        )
+    del _key
+
+    @Slot(str, result=str)
+    def colorFor(self, key: str) -> str:
+        """Get a color by key, or an empty string if the key is unknown."""
+        return self._colors.get(key, "")
 
     def reload_colors(self) -> None:
         """Reload colors from config file and emit change signal."""
         try:
             self._config_data = self._load_config()
-            self._colors = self._config_data.get("colors", DEFAULT_COLORS.copy())
+            self._colors = self._config_data.get("colors", DEFAULT_COLORS)
+            self._cache_colors()
+            self._cache_time_rounding()
             self.colorsChanged.emit()
             logger.info("Colors reloaded successfully")
         except ConfigError as e:
@@ -306,19 +447,18 @@ class ConfigManager(QObject):
         Raises:
             ConfigError: If color key or value is invalid
         """
-        if key not in DEFAULT_COLORS:
+        if key not in _COLOR_KEYS:
             raise ConfigError(f"Unknown color key: {key}")
 
         # Validate single color
-        temp_colors = {key: value}
-        self._validate_colors(temp_colors)
+        self._validate_color(key, value)
 
         # Update colors
-        self._colors[key] = value
-        self._config_data["colors"] = self._colors
+        self._own_colors()[key] = value
+        setattr(self, f"_c_{key}", value)
 
         # Save to file
-        self._save_config(self._config_data)
+        self._schedule_save()
 
         # Emit change signal
         self.colorsChanged.emit()
@@ -334,7 +474,7 @@ class ConfigManager(QObject):
         Returns:
             Configuration value or default
         """
-        keys = key.split(".")
+        keys = _split_key(key)
         value = self._config_data
         
         try:
@@ -351,7 +491,34 @@ class ConfigManager(QObject):
             key: Configuration key (can use dot notation like "colors.primary")
             value: Value to set
         """
-        keys = key.split(".")
+        self.update_values({key: value})
+
+    def update_values(self, values: Dict[str, Any]) -> None:
+        """Set several configuration values with one save and one notification.
+
+        Args:
+            values: Configuration keys (dot notation allowed) mapped to values
+        """
+        sections = set()
+        for key, value in values.items():
+            keys = _split_key(key)
+            self._store_value(keys, value)
+            sections.add(keys[0])
+
+        # Save to file
+        self._schedule_save()
+        
+        if "timeRounding" in sections:
+            self._cache_time_rounding()
+
+        # Emit change signal if colors were updated
+        if "colors" in sections:
+            self.colorsChanged.emit()
+
+    def _store_value(self, keys: Tuple[str, ...], value: Any) -> None:
+        """Store a value under a split key without saving or notifying."""
+        if keys[0] == "colors":
+            self._own_colors()
         config = self._config_data
         
         # Navigate to parent of the key to set
@@ -366,23 +533,18 @@ class ConfigManager(QObject):
         # If we're updating colors, also update the local colors dict
         if keys[0] == "colors" and len(keys) == 2:
             self._colors[keys[1]] = value
-        
-        # Save to file
-        self._save_config(self._config_data)
-        
-        # Emit change signal if colors were updated
-        if keys[0] == "colors":
-            self.colorsChanged.emit()
+            if keys[1] in _COLOR_KEYS:
+                setattr(self, f"_c_{keys[1]}", value)
 
     @Property(bool, notify=timeRoundingChanged)
     def timeRoundingEnabled(self) -> bool:
         """Get whether time rounding is enabled."""
-        return self.get_value("timeRounding.enabled", True)
+        return self._time_rounding_enabled
     
     @Property(int, notify=timeRoundingChanged)
     def timeRoundingMinutes(self) -> int:
         """Get time rounding interval in minutes (15=quarter hours, 30=half hours, 60=full hours)."""
-        return self.get_value("timeRounding.roundingMinutes", 15)
+        return self._time_rounding_minutes
     
     @Slot(bool)
     def setTimeRoundingEnabled(self, enabled: bool) -> None:
@@ -395,7 +557,7 @@ class ConfigManager(QObject):
     def setTimeRoundingMinutes(self, minutes: int) -> None:
         """Set time rounding interval in minutes."""
         logger.info(f"Setting time rounding minutes: {minutes}")
-        if minutes not in [15, 30, 60]:
+        if minutes not in _ROUNDING_MINUTES:
             raise ConfigError(f"Invalid rounding minutes: {minutes}. Must be 15, 30, or 60")
         self.set_value("timeRounding.roundingMinutes", minutes)
         self.timeRoundingChanged.emit()
@@ -408,13 +570,13 @@ class ConfigManager(QObject):
     @Slot(str)
     def setCalendarView(self, view: str) -> None:
         """Set calendar view mode."""
-        if view not in ["month", "week"]:
+        if view not in _CALENDAR_VIEWS:
             raise ConfigError(f"Invalid calendar view: {view}. Must be 'month' or 'week'")
         
         logger.info(f"Setting calendar view: {view}")
         self._calendar_view = view
         self._config_data["calendar_view"] = view
-        self._save_config(self._config_data)
+        self._schedule_save()
         self.calendarViewChanged.emit()
     
     @Slot()
@@ -437,23 +599,23 @@ class ConfigManager(QObject):
     @Slot(int)
     def setWindowWidth(self, width: int) -> None:
         """Set default window width."""
-        if width < 800 or width > 3840:
+        if width not in _WINDOW_WIDTHS:
             raise ConfigError(f"Invalid window width: {width}. Must be between 800 and 3840")
         
         logger.info(f"Setting window width: {width}")
         self._window_width = width
         self._config_data["window_width"] = width
-        self._save_config(self._config_data)
+        self._schedule_save()
         self.windowSizeChanged.emit()
     
     @Slot(int)
     def setWindowHeight(self, height: int) -> None:
         """Set default window height."""
-        if height < 600 or height > 2160:
+        if height not in _WINDOW_HEIGHTS:
             raise ConfigError(f"Invalid window height: {height}. Must be between 600 and 2160")
         
         logger.info(f"Setting window height: {height}")
         self._window_height = height
         self._config_data["window_height"] = height
-        self._save_config(self._config_data)
+        self._schedule_save()
         self.windowSizeChanged.emit()
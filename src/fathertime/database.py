@@ -3,25 +3,136 @@
 import json
 import os
 import re
+import shutil
+from collections import defaultdict
 from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from .config import (
     ARCHIVE_DIRECTORY,
+    BATCH_SAVE_INTERVAL,
     DEFAULT_DB_FILE,
     DEFAULT_SESSIONS_FILE,
 )
 from .exceptions import DatabaseError, ValidationError
+from .fileio import write_private_file
 from .logger import logger
 
 # Import QTimer for batch saving (only if PySide6 is available)
 try:
-    from PySide6.QtCore import QTimer
+    from PySide6.QtCore import QCoreApplication, QTimer
     HAS_QTIMER = True
 except ImportError:
     HAS_QTIMER = False
 
+# Use orjson for faster (de)serialization when available
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Both parsers accept UTF-8 bytes; orjson's decode error subclasses json's
+_json_loads = orjson.loads if HAS_ORJSON else json.loads
+
+# Appended to a data file's name for the copy kept before a migration
+_MIGRATION_BACKUP_SUFFIX = ".pre-migration.bak"
+
+# Name sanitization patterns, compiled once
+# Allow alphanumeric, spaces, hyphens, underscores, parentheses, and basic punctuation
+_ALLOWED_NAME_RE = re.compile(r'^[a-zA-Z0-9\s\-_().,!?:]+$')
+_WHITESPACE_RE = re.compile(r'\s+')
+_DANGEROUS_RE = re.compile(
+    r'<script|javascript:|on\w+\s*=|<\s*iframe|<\s*object|<\s*embed',
+    re.IGNORECASE,
+)
+
+
+def _new_daily_state() -> Dict[str, Any]:
+    """Create the default state of a timer on a date.
+
+    is_running and last_started are stored per date for date-specific timer
+    behavior.
+    """
+    return {
+        "elapsed_seconds": 0,
+        "countdown_seconds": 0,
+        "initial_countdown_seconds": 0,
+        "is_running": False,
+        "last_started": None,
+    }
+
+
+# (key, expected type, type name for errors) entries each data file must hold
+_DATA_SCHEMA = (("timers", list, "list"), ("next_id", int, "integer"))
+_SESSIONS_SCHEMA = (("sessions", list, "list"),)
+_DAILY_STATES_SCHEMA = (("daily_states", dict, "dictionary"),)
+_DAILY_TIMERS_SCHEMA = (("daily_timers", dict, "dictionary"),)
+_TIMER_ORDER_SCHEMA = (("timer_order", dict, "dictionary"),)
+
+
+def _validate_structure(data: Any, schema: Tuple, label: str) -> None:
+    """Validate the top-level shape of a loaded data file.
+
+    Args:
+        data: Parsed file contents
+        schema: Required (key, type, type name) entries
+        label: Name of the data used in error messages
+
+    Raises:
+        ValidationError: If data structure is invalid
+    """
+    if not isinstance(data, dict):
+        raise ValidationError(f"{label} must be a dictionary")
+    for key, expected_type, type_name in schema:
+        if not isinstance(data.get(key), expected_type):
+            raise ValidationError(f"{label} must contain '{key}' {type_name}")
+
+
+def _sanitize_name(name: str, label: str) -> str:
+    """Sanitize a user-supplied name for security and consistency.
+
+    Args:
+        name: Raw name from user input
+        label: Kind of name used in error messages, e.g. "Timer name"
+
+    Returns:
+        Sanitized name
+
+    Raises:
+        ValidationError: If name is invalid after sanitization
+    """
+    if not name or not isinstance(name, str):
+        raise ValidationError(f"{label} must be a non-empty string")
+
+    # Remove leading/trailing whitespace
+    name = name.strip()
+
+    if not name:
+        raise ValidationError(f"{label} cannot be empty or only whitespace")
+
+    # Length validation
+    if len(name) > 100:
+        raise ValidationError(f"{label} too long: {len(name)} characters (max 100)")
+
+    if not _ALLOWED_NAME_RE.match(name):
+        raise ValidationError(
+            f"{label} contains invalid characters. "
+            "Only letters, numbers, spaces, and basic punctuation are allowed."
+        )
+
+    # Remove multiple consecutive spaces
+    name = _WHITESPACE_RE.sub(' ', name)
+
+    # Security: Remove any potential script injection patterns. Every pattern
+    # needs one of these characters, so plain names skip the regex scan.
+    suspicious = "<" in name or ":" in name or "=" in name
+    if suspicious and _DANGEROUS_RE.search(name):
+        raise ValidationError(f"{label} contains potentially dangerous content")
+
+    return name
+
 
 class Database:
     """Handles all database operations for timers and sessions."""
@@ -41,20 +152,6 @@ class Database:
         self.timer_order_file = self.data_dir / "timer_order.json"
         self.archive_dir = self.data_dir / ARCHIVE_DIRECTORY
 
-        try:
-            self.data = self._load_data()
-            self.sessions = self._load_sessions()
-            self.daily_states = self._load_daily_states()
-            self.daily_timers = self._load_daily_timers()
-            self.timer_order = self._load_timer_order()
-            self._check_and_archive_old_data()
-            logger.info(
-                f"Database initialized with {len(self.data.get('timers', []))} timers"
-            )
-        except Exception as e:
-            logger.error(f"Failed to initialize database: {e}")
-            raise DatabaseError(f"Database initialization failed: {e}") from e
-            
         # Initialize batch saving system to reduce I/O operations
         self._pending_saves = {
             'data': False,
@@ -63,17 +160,49 @@ class Database:
             'daily_timers': False,
             'timer_order': False
         }
-        
-        # Set up batch save timer if Qt is available
-        if HAS_QTIMER:
+        # Hash of the last payload written to each file, to skip rewriting
+        # identical content
+        self._saved_hashes: Dict[Path, int] = {}
+        
+        # Set up batch save timer if Qt is available. The timer needs a running
+        # application to fire, and pending saves are flushed when it quits.
+        # It is single-shot and only started by the first change after a save,
+        # so an idle app never wakes up to find nothing to write.
+        app = QCoreApplication.instance() if HAS_QTIMER else None
+        if app is not None:
             self._batch_save_timer = QTimer()
+            self._batch_save_timer.setSingleShot(True)
+            self._batch_save_timer.setInterval(BATCH_SAVE_INTERVAL)
             self._batch_save_timer.timeout.connect(self._batch_save_all)
-            self._batch_save_timer.start(10000)  # Save every 10 seconds
-            logger.debug("Batch saving system initialized with 10-second intervals")
+            app.aboutToQuit.connect(self.flush_all_saves)
+            logger.debug("Batch saving system initialized with 10-second delay")
+        elif HAS_QTIMER:
+            self._batch_save_timer = None
+            logger.debug("No Qt application running - saving changes immediately")
         else:
             self._batch_save_timer = None
             logger.warning("QTimer not available - batch saving disabled")
 
+        # Timer IDs referenced by daily_timers with no global timer, logged once
+        self._orphan_timer_ids = set()
+
+        try:
+            self.data = self._load_data()
+            self.sessions = self._load_sessions()
+            self.daily_states = self._load_daily_states()
+            self.daily_timers = self._load_daily_timers()
+            self.timer_order = self._load_timer_order()
+            self._index_timers()
+            self._index_sessions()
+            self._migrate_daily_timer_copies()
+            self._check_and_archive_old_data()
+            logger.info(
+                f"Database initialized with {len(self.data.get('timers', []))} timers"
+            )
+        except Exception as e:
+            logger.error(f"Failed to initialize database: {e}")
+            raise DatabaseError(f"Database initialization failed: {e}") from e
+
     def _sanitize_timer_name(self, name: str) -> str:
         """Sanitize timer name for security and consistency.
         
@@ -86,52 +215,8 @@ class Database:
         Raises:
             ValidationError: If name is invalid after sanitization
         """
-        if not name or not isinstance(name, str):
-            raise ValidationError("Timer name must be a non-empty string")
-            
-        # Remove leading/trailing whitespace
-        name = name.strip()
-        
-        if not name:
-            raise ValidationError("Timer name cannot be empty or only whitespace")
-            
-        # Length validation
-        if len(name) > 100:
-            raise ValidationError(f"Timer name too long: {len(name)} characters (max 100)")
-            
-        if len(name) < 1:
-            raise ValidationError("Timer name too short")
-            
-        # Remove or replace dangerous characters
-        # Allow alphanumeric, spaces, hyphens, underscores, parentheses, and basic punctuation
-        allowed_pattern = re.compile(r'^[a-zA-Z0-9\s\-_().,!?:]+$')
-        if not allowed_pattern.match(name):
-            raise ValidationError(
-                "Timer name contains invalid characters. "
-                "Only letters, numbers, spaces, and basic punctuation are allowed."
-            )
-            
-        # Remove multiple consecutive spaces
-        name = re.sub(r'\s+', ' ', name)
-        
-        # Security: Remove any potential script injection patterns
-        dangerous_patterns = [
-            r'<script',
-            r'javascript:',
-            r'on\w+\s*=',
-            r'<\s*iframe',
-            r'<\s*object',
-            r'<\s*embed'
-        ]
-        
-        for pattern in dangerous_patterns:
-            if re.search(pattern, name, re.IGNORECASE):
-                raise ValidationError(
-                    "Timer name contains potentially dangerous content"
-                )
-                
-        return name
-        
+        return _sanitize_name(name, "Timer name")
+
     def _sanitize_project_name(self, name: str) -> str:
         """Sanitize project name for security and consistency.
         
@@ -144,50 +229,14 @@ class Database:
         Raises:
             ValidationError: If name is invalid after sanitization
         """
-        if not name or not isinstance(name, str):
-            raise ValidationError("Project name must be a non-empty string")
-            
-        # Remove leading/trailing whitespace
-        name = name.strip()
-        
-        if not name:
-            raise ValidationError("Project name cannot be empty or only whitespace")
-            
-        # Length validation
-        if len(name) > 100:
-            raise ValidationError(f"Project name too long: {len(name)} characters (max 100)")
-            
-        # Use same sanitization as timer names
-        allowed_pattern = re.compile(r'^[a-zA-Z0-9\s\-_().,!?:]+$')
-        if not allowed_pattern.match(name):
-            raise ValidationError(
-                "Project name contains invalid characters. "
-                "Only letters, numbers, spaces, and basic punctuation are allowed."
-            )
-            
-        # Remove multiple consecutive spaces
-        name = re.sub(r'\s+', ' ', name)
-        
-        # Security: Remove any potential script injection patterns
-        dangerous_patterns = [
-            r'<script',
-            r'javascript:',
-            r'on\w+\s*=',
-            r'<\s*iframe',
-            r'<\s*object',
-            r'<\s*embed'
-        ]
-        
-        for pattern in dangerous_patterns:
-            if re.search(pattern, name, re.IGNORECASE):
-                raise ValidationError(
-                    "Project name contains potentially dangerous content"
-                )
-                
-        return name
+        return _sanitize_name(name, "Project name")
 
-    def _batch_save_all(self) -> None:
-        """Save all pending changes to disk in a single batch operation."""
+    def _batch_save_all(self, durable: bool = False) -> None:
+        """Save all pending changes to disk in a single batch operation.
+
+        Args:
+            durable: If True, fsync each file as it is written
+        """
         if not any(self._pending_saves.values()):
             return  # No pending saves
             
@@ -195,27 +244,27 @@ class Database:
         
         try:
             if self._pending_saves['data']:
-                self._save_data_to_file(self.data, self.db_file)
+                self._save_data_to_file(self.data, self.db_file, durable=durable)
                 self._pending_saves['data'] = False
                 saved_files.append('timers')
                 
             if self._pending_saves['sessions']:
-                self._save_data_to_file(self.sessions, self.sessions_file)
+                self._save_data_to_file(self.sessions, self.sessions_file, durable=durable)
                 self._pending_saves['sessions'] = False
                 saved_files.append('sessions')
                 
             if self._pending_saves['daily_states']:
-                self._save_data_to_file(self.daily_states, self.daily_states_file)
+                self._save_data_to_file(self.daily_states, self.daily_states_file, durable=durable)
                 self._pending_saves['daily_states'] = False
                 saved_files.append('daily_states')
                 
             if self._pending_saves['daily_timers']:
-                self._save_data_to_file(self.daily_timers, self.daily_timers_file)
+                self._save_data_to_file(self.daily_timers, self.daily_timers_file, durable=durable)
                 self._pending_saves['daily_timers'] = False
                 saved_files.append('daily_timers')
                 
             if self._pending_saves['timer_order']:
-                self._save_data_to_file(self.timer_order, self.timer_order_file)
+                self._save_data_to_file(self.timer_order, self.timer_order_file, durable=durable)
                 self._pending_saves['timer_order'] = False
                 saved_files.append('timer_order')
                 
@@ -224,6 +273,9 @@ class Database:
                 
         except Exception as e:
             logger.error(f"Batch save failed: {e}")
+            # Retry the files that are still pending after another interval
+            if self._batch_save_timer and not self._batch_save_timer.isActive():
+                self._batch_save_timer.start()
             
     def _mark_for_save(self, data_type: str) -> None:
         """Mark a data type for batch saving.
@@ -233,44 +285,79 @@ class Database:
         """
         if data_type in self._pending_saves:
             self._pending_saves[data_type] = True
+            if self._batch_save_timer and not self._batch_save_timer.isActive():
+                self._batch_save_timer.start()
         else:
             logger.warning(f"Unknown data type for batch save: {data_type}")
             
     def flush_all_saves(self) -> None:
-        """Immediately save all pending changes (used for shutdown or critical operations)."""
+        """Immediately save all pending changes (used for shutdown or critical operations).
+
+        These writes are synced to disk, unlike the periodic batch saves.
+        """
         if any(self._pending_saves.values()):
             logger.info("Flushing all pending saves...")
-            self._batch_save_all()
+            self._batch_save_all(durable=True)
 
-    def _load_data(self) -> Dict[str, Any]:
-        """Load timer data from JSON file.
+    def _load_json_file(
+        self,
+        file_path: Path,
+        default: Dict[str, Any],
+        schema: Tuple,
+        description: str,
+    ) -> Dict[str, Any]:
+        """Load and validate one of the JSON data files.
+
+        A missing file is created with the default contents.
+
+        Args:
+            file_path: Path of the file to load
+            default: Contents to use and save when the file does not exist
+            schema: Required (key, type, type name) entries
+            description: Name of the file used in messages, e.g. "sessions"
 
         Returns:
-            Dictionary containing timers data
+            The parsed file contents
 
         Raises:
             DatabaseError: If file cannot be loaded
+            ValidationError: If the contents do not match the schema
         """
-        default_data = {"timers": [], "next_id": 1}
-
-        if not self.db_file.exists():
+        try:
+            with open(file_path, "rb") as f:
+                raw = f.read()
+        except FileNotFoundError:
             logger.info(
-                f"Database file {self.db_file} does not exist, creating new one"
+                f"{description.capitalize()} file {file_path} does not exist, "
+                "creating new one"
             )
-            self._save_data_to_file(default_data, self.db_file)
-            return default_data
+            self._save_data_to_file(default, file_path)
+            return default
+        except IOError as e:
+            logger.error(f"Cannot read {description} file: {e}")
+            raise DatabaseError(f"Cannot read {description} file: {e}") from e
 
         try:
-            with open(self.db_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                self._validate_data_structure(data)
-                return data
+            data = _json_loads(raw)
         except json.JSONDecodeError as e:
-            logger.error(f"Invalid JSON in database file: {e}")
-            raise DatabaseError(f"Corrupt database file: {e}") from e
-        except IOError as e:
-            logger.error(f"Cannot read database file: {e}")
-            raise DatabaseError(f"Cannot read database file: {e}") from e
+            logger.error(f"Invalid JSON in {description} file: {e}")
+            raise DatabaseError(f"Corrupt {description} file: {e}") from e
+
+        _validate_structure(data, schema, f"{description.capitalize()} data")
+        return data
+
+    def _load_data(self) -> Dict[str, Any]:
+        """Load timer data from JSON file.
+
+        Returns:
+            Dictionary containing timers data
+
+        Raises:
+            DatabaseError: If file cannot be loaded
+        """
+        return self._load_json_file(
+            self.db_file, {"timers": [], "next_id": 1}, _DATA_SCHEMA, "timer"
+        )
 
     def _load_sessions(self) -> Dict[str, Any]:
         """Load session data from JSON file.
@@ -281,26 +368,19 @@ class Database:
         Raises:
             DatabaseError: If file cannot be loaded
         """
-        default_sessions = {"sessions": []}
-
-        if not self.sessions_file.exists():
-            logger.info(
-                f"Sessions file {self.sessions_file} does not exist, creating new one"
-            )
-            self._save_data_to_file(default_sessions, self.sessions_file)
-            return default_sessions
-
-        try:
-            with open(self.sessions_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                self._validate_sessions_structure(data)
-                return data
-        except json.JSONDecodeError as e:
-            logger.error(f"Invalid JSON in sessions file: {e}")
-            raise DatabaseError(f"Corrupt sessions file: {e}") from e
-        except IOError as e:
-            logger.error(f"Cannot read sessions file: {e}")
-            raise DatabaseError(f"Cannot read sessions file: {e}") from e
+        data = self._load_json_file(
+            self.sessions_file,
+            {"sessions": [], "next_session_id": 1},
+            _SESSIONS_SCHEMA,
+            "sessions",
+        )
+        if "next_session_id" not in data:
+            # Files written before the counter existed
+            existing_ids = [s.get("id", 0) for s in data["sessions"]]
+            data["next_session_id"] = max(existing_ids, default=0) + 1
+        elif not isinstance(data["next_session_id"], int):
+            raise ValidationError("Sessions 'next_session_id' must be an integer")
+        return data
 
     def _load_daily_states(self) -> Dict[str, Any]:
         """Load daily timer states from JSON file.
@@ -311,26 +391,12 @@ class Database:
         Raises:
             DatabaseError: If file cannot be loaded
         """
-        default_states = {"daily_states": {}}
-
-        if not self.daily_states_file.exists():
-            logger.info(
-                f"Daily states file {self.daily_states_file} does not exist, creating new one"
-            )
-            self._save_data_to_file(default_states, self.daily_states_file)
-            return default_states
-
-        try:
-            with open(self.daily_states_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                self._validate_daily_states_structure(data)
-                return data
-        except json.JSONDecodeError as e:
-            logger.error(f"Invalid JSON in daily states file: {e}")
-            raise DatabaseError(f"Corrupt daily states file: {e}") from e
-        except IOError as e:
-            logger.error(f"Cannot read daily states file: {e}")
-            raise DatabaseError(f"Cannot read daily states file: {e}") from e
+        return self._load_json_file(
+            self.daily_states_file,
+            {"daily_states": {}},
+            _DAILY_STATES_SCHEMA,
+            "daily states",
+        )
 
     def save_data(self, immediate: bool = False) -> None:
         """Save timer data to JSON file.
@@ -382,31 +448,40 @@ class Database:
         cutoff_date = date.today() - timedelta(days=14)
         cutoff_str = cutoff_date.isoformat()
 
+        sessions = self.sessions.get("sessions", [])
+
+        # This runs on every startup and usually finds nothing to archive, so
+        # check before building the two partitions
+        if not any(session.get("date", "") < cutoff_str for session in sessions):
+            return
+
         # Find sessions older than 2 weeks
         old_sessions = []
         recent_sessions = []
 
-        for session in self.sessions.get("sessions", []):
+        for session in sessions:
             session_date = session.get("date", "")
             if session_date < cutoff_str:
                 old_sessions.append(session)
             else:
                 recent_sessions.append(session)
 
-        # If we have old sessions, archive them
-        if old_sessions:
-            self._archive_sessions(old_sessions, cutoff_date)
-            self.sessions["sessions"] = recent_sessions
-            self.save_sessions()
+        self._archive_sessions(old_sessions, cutoff_date)
+        self._set_sessions(recent_sessions)
+        self.save_sessions()
 
     def _archive_sessions(self, sessions: List[Dict], cutoff_date: date):
         """Archive old sessions to dated folder"""
-        if not os.path.exists(self.archive_dir):
-            os.makedirs(self.archive_dir)
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
 
         # Create archive filename with date range
-        oldest_date = min(session.get("date", "") for session in sessions)
-        newest_date = max(session.get("date", "") for session in sessions)
+        oldest_date = newest_date = sessions[0].get("date", "")
+        for session in sessions:
+            session_date = session.get("date", "")
+            if session_date < oldest_date:
+                oldest_date = session_date
+            elif session_date > newest_date:
+                newest_date = session_date
         archive_file = (
             f"{self.archive_dir}/sessions_{oldest_date}_to_{newest_date}.json"
         )
@@ -426,72 +501,58 @@ class Database:
             logger.error(f"Error archiving sessions: {e}")
             raise DatabaseError(f"Cannot archive sessions: {e}") from e
 
-    def _save_data_to_file(self, data: Dict[str, Any], file_path: Path) -> None:
+    def _save_data_to_file(
+        self,
+        data: Dict[str, Any],
+        file_path: Path,
+        compact: bool = True,
+        durable: bool = False,
+    ) -> None:
         """Save data to JSON file with error handling.
 
+        The data is written to a temporary file that is then renamed over the
+        target, so a crash mid-write never leaves a truncated file.
+
         Args:
             data: Data to save
             file_path: Path to save file
+            compact: If True, write without indentation (the data files are
+                only read by the app); otherwise indent for readability
+            durable: If True, fsync the file before renaming it so the data
+                survives a power loss. Only flush_all_saves asks for this;
+                routine saves leave flushing to the OS.
 
         Raises:
             DatabaseError: If file cannot be saved
         """
         try:
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-            
-            # Set secure file permissions (owner read/write only)
-            file_path.chmod(0o600)
+            if HAS_ORJSON:
+                option = orjson.OPT_NON_STR_KEYS
+                if not compact:
+                    option |= orjson.OPT_INDENT_2
+                payload = orjson.dumps(data, option=option)
+            else:
+                json_format = (
+                    {"separators": (",", ":")} if compact else {"indent": 2}
+                )
+                payload = json.dumps(
+                    data, ensure_ascii=False, **json_format
+                ).encode("utf-8")
+
+            # Changes that were undone before the batch ran leave the file
+            # as it is. Shutdown flushes still write so the data gets synced.
+            payload_hash = hash(payload)
+            if not durable and self._saved_hashes.get(file_path) == payload_hash:
+                logger.debug(f"{file_path} unchanged, skipping save")
+                return
+
+            write_private_file(file_path, payload, durable)
+            self._saved_hashes[file_path] = payload_hash
             logger.debug(f"Data saved to {file_path} with secure permissions")
         except IOError as e:
             logger.error(f"Cannot save to {file_path}: {e}")
             raise DatabaseError(f"Cannot save to {file_path}: {e}") from e
 
-    def _validate_data_structure(self, data: Dict[str, Any]) -> None:
-        """Validate timer data structure.
-
-        Args:
-            data: Data to validate
-
-        Raises:
-            ValidationError: If data structure is invalid
-        """
-        if not isinstance(data, dict):
-            raise ValidationError("Data must be a dictionary")
-        if "timers" not in data or not isinstance(data["timers"], list):
-            raise ValidationError("Data must contain 'timers' list")
-        if "next_id" not in data or not isinstance(data["next_id"], int):
-            raise ValidationError("Data must contain 'next_id' integer")
-
-    def _validate_sessions_structure(self, data: Dict[str, Any]) -> None:
-        """Validate session data structure.
-
-        Args:
-            data: Data to validate
-
-        Raises:
-            ValidationError: If data structure is invalid
-        """
-        if not isinstance(data, dict):
-            raise ValidationError("Sessions data must be a dictionary")
-        if "sessions" not in data or not isinstance(data["sessions"], list):
-            raise ValidationError("Sessions data must contain 'sessions' list")
-
-    def _validate_daily_states_structure(self, data: Dict[str, Any]) -> None:
-        """Validate daily states data structure.
-
-        Args:
-            data: Data to validate
-
-        Raises:
-            ValidationError: If data structure is invalid
-        """
-        if not isinstance(data, dict):
-            raise ValidationError("Daily states data must be a dictionary")
-        if "daily_states" not in data or not isinstance(data["daily_states"], dict):
-            raise ValidationError("Daily states data must contain 'daily_states' dictionary")
-
     def _load_daily_timers(self) -> Dict[str, Any]:
         """Load daily timers from JSON file.
 
@@ -501,40 +562,12 @@ class Database:
         Raises:
             DatabaseError: If file cannot be loaded
         """
-        default_timers = {"daily_timers": {}}
-
-        if not self.daily_timers_file.exists():
-            logger.info(
-                f"Daily timers file {self.daily_timers_file} does not exist, creating new one"
-            )
-            self._save_data_to_file(default_timers, self.daily_timers_file)
-            return default_timers
-
-        try:
-            with open(self.daily_timers_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                self._validate_daily_timers_structure(data)
-                return data
-        except json.JSONDecodeError as e:
-            logger.error(f"Invalid JSON in daily timers file: {e}")
-            raise DatabaseError(f"Corrupt daily timers file: {e}") from e
-        except IOError as e:
-            logger.error(f"Cannot read daily timers file: {e}")
-            raise DatabaseError(f"Cannot read daily timers file: {e}") from e
-
-    def _validate_daily_timers_structure(self, data: Dict[str, Any]) -> None:
-        """Validate daily timers data structure.
-
-        Args:
-            data: Data to validate
-
-        Raises:
-            ValidationError: If data structure is invalid
-        """
-        if not isinstance(data, dict):
-            raise ValidationError("Daily timers data must be a dictionary")
-        if "daily_timers" not in data or not isinstance(data["daily_timers"], dict):
-            raise ValidationError("Daily timers data must contain 'daily_timers' dictionary")
+        return self._load_json_file(
+            self.daily_timers_file,
+            {"daily_timers": {}},
+            _DAILY_TIMERS_SCHEMA,
+            "daily timers",
+        )
 
     def save_daily_timers(self, immediate: bool = False) -> None:
         """Save daily timers to JSON file.
@@ -560,39 +593,13 @@ class Database:
         Raises:
             DatabaseError: If file cannot be loaded or is corrupted
         """
-        default_data = {"timer_order": {}}
-        
-        if not self.timer_order_file.exists():
-            logger.info(f"Timer order file {self.timer_order_file} not found, creating default")
-            self._save_data_to_file(default_data, self.timer_order_file)
-            return default_data
-            
-        try:
-            with open(self.timer_order_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                self._validate_timer_order_data(data)
-                return data
-        except json.JSONDecodeError as e:
-            logger.error(f"Invalid JSON in timer order file: {e}")
-            raise DatabaseError(f"Corrupt timer order file: {e}") from e
-        except IOError as e:
-            logger.error(f"Cannot read timer order file: {e}")
-            raise DatabaseError(f"Cannot read timer order file: {e}") from e
-    
-    def _validate_timer_order_data(self, data: Dict[str, Any]) -> None:
-        """Validate timer order data structure.
-        
-        Args:
-            data: Timer order data to validate
-            
-        Raises:
-            ValidationError: If data structure is invalid
-        """
-        if not isinstance(data, dict):
-            raise ValidationError("Timer order data must be a dictionary")
-        if "timer_order" not in data or not isinstance(data["timer_order"], dict):
-            raise ValidationError("Timer order data must contain 'timer_order' dictionary")
-    
+        return self._load_json_file(
+            self.timer_order_file,
+            {"timer_order": {}},
+            _TIMER_ORDER_SCHEMA,
+            "timer order",
+        )
+
     def save_timer_order(self, immediate: bool = False) -> None:
         """Save timer order to JSON file.
 
@@ -642,6 +649,200 @@ class Database:
         self.timer_order["timer_order"][date_str] = timer_ids
         self.save_timer_order()
 
+    def _set_timers(self, timers: List[Dict[str, Any]]) -> None:
+        """Replace the global timers list and rebuild its index.
+
+        Every replacement or filtering of self.data["timers"] goes through
+        here; single additions and removals update the index directly.
+        """
+        self.data["timers"] = timers
+        self._index_timers()
+
+    def _index_timers(self) -> None:
+        """Rebuild the id -> timer index over the global timers list.
+
+        Called directly only after self.data itself is loaded or replaced.
+        """
+        # Reversed so the first timer wins if a file ever holds duplicate ids
+        self._timers_by_id = {
+            timer["id"]: timer for timer in reversed(self.data["timers"])
+        }
+
+    def _migrate_daily_timer_copies(self) -> None:
+        """Replace timer copies in daily_timers with timer ID references.
+
+        Older files stored a full copy of each timer per date, and the same
+        ID could appear on many dates. Each date's copy behaved as its own
+        timer (a non-favorite rename only changed that date), so only the
+        earliest date keeps the original ID. Copies on later dates become new
+        timers, and that date's daily states, timer order and sessions are
+        remapped to the new ID. The copy is what the UI showed, so it wins
+        over the global entry.
+
+        The affected files are backed up before anything is rewritten, and
+        the result is written straight away with daily_timers last. A run
+        that stops before then leaves the copies in place, so the next start
+        migrates again; split-off timers record the ID and date they came
+        from in "split_from" and are reused rather than created twice.
+
+        Raises:
+            DatabaseError: If the backup cannot be made
+        """
+        all_daily_timers = self.daily_timers.get("daily_timers", {})
+        if not any(
+            isinstance(entry, dict)
+            for entries in all_daily_timers.values()
+            for entry in entries
+        ):
+            return
+
+        self._backup_before_migration()
+
+        # Copies whose ID is missing from the global table keep that ID, so
+        # new IDs must start above every ID in use
+        used_ids = set(self._timers_by_id)
+        for entries in all_daily_timers.values():
+            for entry in entries:
+                used_ids.add(entry["id"] if isinstance(entry, dict) else entry)
+        self.data["next_id"] = max(self.data["next_id"], max(used_ids) + 1)
+
+        # Split-off timers saved by a run that stopped before daily_timers
+        split_timers = {
+            tuple(timer["split_from"]): timer
+            for timer in self.data["timers"]
+            if "split_from" in timer
+        }
+
+        claimed_ids = set()
+        split_count = 0
+        for date_str in sorted(all_daily_timers):
+            timer_ids = []
+            for entry in all_daily_timers[date_str]:
+                if isinstance(entry, dict):
+                    timer_id = entry["id"]
+                    if timer_id in claimed_ids:
+                        # Another date already owns this ID
+                        split = split_timers.pop((timer_id, date_str), None)
+                        if split is None:
+                            new_id = self._get_next_timer_id()
+                            split = dict(
+                                entry, id=new_id, split_from=[timer_id, date_str]
+                            )
+                            self.data["timers"].append(split)
+                            self._timers_by_id[new_id] = split
+                            split_count += 1
+                        self._remap_timer_id_on_date(date_str, timer_id, split["id"])
+                        timer_id = split["id"]
+                    else:
+                        timer = self._timers_by_id.get(timer_id)
+                        if timer is None:
+                            self.data["timers"].append(entry)
+                            self._timers_by_id[timer_id] = entry
+                        else:
+                            timer.update(entry)
+                else:
+                    timer_id = entry
+                claimed_ids.add(timer_id)
+                timer_ids.append(timer_id)
+            all_daily_timers[date_str] = timer_ids
+
+        # daily_timers goes last: until it is written the copies are still
+        # on disk, and the next start redoes the migration from them
+        for data_type, data, file_path in (
+            ("data", self.data, self.db_file),
+            ("sessions", self.sessions, self.sessions_file),
+            ("daily_states", self.daily_states, self.daily_states_file),
+            ("timer_order", self.timer_order, self.timer_order_file),
+            ("daily_timers", self.daily_timers, self.daily_timers_file),
+        ):
+            self._save_data_to_file(data, file_path, durable=True)
+            self._pending_saves[data_type] = False
+
+        logger.info(
+            f"Migrated daily timers to timer ID references "
+            f"({split_count} per-date copies given their own ID)"
+        )
+
+    def _backup_before_migration(self) -> None:
+        """Copy the files a data migration rewrites next to the originals.
+
+        Existing backups are kept, so a second run never overwrites the
+        copy of the original data.
+
+        Raises:
+            DatabaseError: If a file cannot be copied
+        """
+        for file_path in (
+            self.db_file,
+            self.sessions_file,
+            self.daily_states_file,
+            self.daily_timers_file,
+            self.timer_order_file,
+        ):
+            backup_path = file_path.with_name(
+                file_path.name + _MIGRATION_BACKUP_SUFFIX
+            )
+            if not file_path.exists() or backup_path.exists():
+                continue
+            try:
+                shutil.copy2(file_path, backup_path)
+            except OSError as e:
+                logger.error(f"Cannot back up {file_path} before migration: {e}")
+                raise DatabaseError(f"Cannot back up {file_path}: {e}") from e
+            logger.info(f"Backed up {file_path} to {backup_path}")
+
+    def _remap_timer_id_on_date(self, date_str: str, old_id: int, new_id: int) -> None:
+        """Point one date's states, order and sessions at a timer's new ID."""
+        day_states = self.daily_states.get("daily_states", {}).get(date_str)
+        if day_states and str(old_id) in day_states:
+            day_states[str(new_id)] = day_states.pop(str(old_id))
+
+        order = self.timer_order.get("timer_order", {}).get(date_str)
+        if order:
+            order[:] = [new_id if tid == old_id else tid for tid in order]
+
+        for session in self.sessions.get("sessions", []):
+            if session.get("date") == date_str and session.get("timer_id") == old_id:
+                session["timer_id"] = new_id
+
+    def _resolve_timers(self, timer_ids: List[int]) -> List[Dict[str, Any]]:
+        """Get the timers for a date's list of timer IDs.
+
+        IDs with no global timer are skipped; each one is logged once.
+        """
+        timers_by_id = self._timers_by_id
+        timers = []
+        for timer_id in timer_ids:
+            timer = timers_by_id.get(timer_id)
+            if timer is not None:
+                timers.append(timer)
+            elif timer_id not in self._orphan_timer_ids:
+                self._orphan_timer_ids.add(timer_id)
+                logger.warning(
+                    f"Daily timers reference unknown timer ID {timer_id}, skipping it"
+                )
+        return timers
+
+    def _set_sessions(self, sessions: List[Dict[str, Any]]) -> None:
+        """Replace the sessions list and rebuild its indexes.
+
+        Every replacement of self.sessions["sessions"] goes through here;
+        start_session adds new sessions to the indexes directly.
+        """
+        self.sessions["sessions"] = sessions
+        self._index_sessions()
+
+    def _index_sessions(self) -> None:
+        """Rebuild the id -> session and date -> sessions indexes.
+
+        Called directly only after self.sessions itself is loaded or replaced.
+        """
+        self._sessions_by_id = {}
+        self._sessions_by_date = defaultdict(list)
+        for session in self.sessions.get("sessions", []):
+            self._sessions_by_id[session.get("id")] = session
+            self._sessions_by_date[session.get("date", "")].append(session)
+
     def get_all_timers(self) -> List[Dict]:
         return self.data.get("timers", [])
 
@@ -679,6 +880,7 @@ class Database:
             "last_started": None,
         }
         self.data["timers"].append(timer)
+        self._timers_by_id[timer_id] = timer
         self.data["next_id"] += 1
         self.save_data()
         return timer_id
@@ -701,20 +903,23 @@ class Database:
             raise ValidationError("Timer ID must be a positive integer")
         if not isinstance(updates, dict) or not updates:
             raise ValidationError("Updates must be a non-empty dictionary")
-        for timer in self.data["timers"]:
-            if timer["id"] == timer_id:
-                timer.update(updates)
-                self.save_data()
-                return True
-        return False
+        timer = self._timers_by_id.get(timer_id)
+        if timer is None:
+            return False
+        # UI refreshes often write back the values already stored
+        if updates.items() <= timer.items():
+            return True
+        timer.update(updates)
+        self.save_data()
+        return True
 
     def delete_timer(self, timer_id: int) -> bool:
-        original_length = len(self.data["timers"])
+        if timer_id not in self._timers_by_id:
+            return False
         self.data["timers"] = [t for t in self.data["timers"] if t["id"] != timer_id]
-        if len(self.data["timers"]) < original_length:
-            self.save_data()
-            return True
-        return False
+        del self._timers_by_id[timer_id]
+        self.save_data()
+        return True
 
     def get_timer(self, timer_id: int) -> Optional[Dict[str, Any]]:
         """Get timer by ID.
@@ -730,10 +935,15 @@ class Database:
         """
         if not isinstance(timer_id, int) or timer_id <= 0:
             raise ValidationError("Timer ID must be a positive integer")
-        for timer in self.data["timers"]:
-            if timer["id"] == timer_id:
-                return timer
-        return None
+        return self._timers_by_id.get(timer_id)
+
+    def _day_states(self, date_str: str) -> Dict[str, Dict[str, Any]]:
+        """Get the per-timer states for a date, creating the containers if needed."""
+        all_states = self.daily_states.setdefault("daily_states", {})
+        day_states = all_states.get(date_str)
+        if day_states is None:
+            day_states = all_states[date_str] = {}
+        return day_states
 
     def get_daily_timer_state(self, timer_id: int, date_str: str) -> Dict[str, Any]:
         """Get timer state for a specific date.
@@ -745,25 +955,15 @@ class Database:
         Returns:
             Dictionary with timer state for that date
         """
-        if "daily_states" not in self.daily_states:
-            self.daily_states["daily_states"] = {}
-            
-        if date_str not in self.daily_states["daily_states"]:
-            self.daily_states["daily_states"][date_str] = {}
-            
-        if str(timer_id) not in self.daily_states["daily_states"][date_str]:
+        day_states = self._day_states(date_str)
+        timer_key = str(timer_id)
+        state = day_states.get(timer_key)
+        if state is None:
             # Create default state for this timer on this date
-            # Now storing is_running and last_started per date for date-specific timer behavior
-            self.daily_states["daily_states"][date_str][str(timer_id)] = {
-                "elapsed_seconds": 0,
-                "countdown_seconds": 0,
-                "initial_countdown_seconds": 0,
-                "is_running": False,
-                "last_started": None
-            }
+            state = day_states[timer_key] = _new_daily_state()
             self.save_daily_states()
             
-        return self.daily_states["daily_states"][date_str][str(timer_id)]
+        return state
 
     def update_daily_timer_state(self, timer_id: int, date_str: str, updates: Dict[str, Any]) -> None:
         """Update timer state for a specific date.
@@ -773,23 +973,15 @@ class Database:
             date_str: Date string in YYYY-MM-DD format
             updates: Dictionary of fields to update
         """
-        if "daily_states" not in self.daily_states:
-            self.daily_states["daily_states"] = {}
-            
-        if date_str not in self.daily_states["daily_states"]:
-            self.daily_states["daily_states"][date_str] = {}
-            
-        if str(timer_id) not in self.daily_states["daily_states"][date_str]:
-            # Now storing is_running and last_started per date for date-specific timer behavior
-            self.daily_states["daily_states"][date_str][str(timer_id)] = {
-                "elapsed_seconds": 0,
-                "countdown_seconds": 0,
-                "initial_countdown_seconds": 0,
-                "is_running": False,
-                "last_started": None
-            }
-            
-        self.daily_states["daily_states"][date_str][str(timer_id)].update(updates)
+        day_states = self._day_states(date_str)
+        timer_key = str(timer_id)
+        state = day_states.get(timer_key)
+        if state is None:
+            state = day_states[timer_key] = _new_daily_state()
+        elif updates.items() <= state.items():
+            return
+
+        state.update(updates)
         self.save_daily_states()
 
     def get_timers_for_date(self, date_str: str) -> List[Dict]:
@@ -801,91 +993,74 @@ class Database:
         Returns:
             List of timer dictionaries for that date, including propagated favorites
         """
-        if "daily_timers" not in self.daily_timers:
-            self.daily_timers["daily_timers"] = {}
+        daily_timers = self.daily_timers.setdefault("daily_timers", {})
             
-        # Get existing timers for this date
-        existing_timers = []
-        if date_str in self.daily_timers["daily_timers"]:
-            existing_timers = self.daily_timers["daily_timers"][date_str]
-        
         # Get existing timer names to avoid duplicates
+        existing_timers = self._resolve_timers(daily_timers.get(date_str, []))
         existing_names = {timer["name"] for timer in existing_timers}
         
         # Find ALL favorited timers from ALL dates that aren't already on this date
         favorited_timers = []
-        all_favorited_names = set()
         
-        # Collect unique favorited timer names from all dates
-        for other_date, timers in self.daily_timers.get("daily_timers", {}).items():
-            for timer in timers:
+        # Collect the most recent favorited instance of each name in one pass
+        # over all dates, rather than rescanning every date per name
+        best_instances = {}  # name -> (date, timer)
+        for other_date, timer_ids in daily_timers.items():
+            for timer in self._resolve_timers(timer_ids):
                 if timer.get("is_favorite", False):
-                    all_favorited_names.add(timer["name"])
+                    best = best_instances.get(timer["name"])
+                    if best is None or other_date > best[0]:  # More recent date
+                        best_instances[timer["name"]] = (other_date, timer)
         
         # Also check global timers for any favorited ones not in daily_timers yet
         for timer in self.data.get("timers", []):
             if timer.get("is_favorite", False):
-                all_favorited_names.add(timer["name"])
+                best_instances.setdefault(timer["name"], (None, timer))
         
-        # For each favorited name not on current date, find the best instance to propagate
-        for fav_name in all_favorited_names:
-            if fav_name not in existing_names:
-                # Find the most recent or most used instance of this favorited timer
-                best_timer = None
-                best_date = None
-                
-                # Look through all dates to find the best instance
-                for other_date, timers in self.daily_timers.get("daily_timers", {}).items():
-                    for timer in timers:
-                        if timer["name"] == fav_name and timer.get("is_favorite", False):
-                            if best_timer is None or other_date > best_date:  # More recent date
-                                best_timer = timer
-                                best_date = other_date
-                
-                # If no instance found in daily_timers, check global timers
-                if best_timer is None:
-                    for timer in self.data.get("timers", []):
-                        if timer["name"] == fav_name and timer.get("is_favorite", False):
-                            best_timer = timer
-                            break
-                
-                if best_timer:
-                    # Create a new timer instance for this date with reset times
-                    new_timer = best_timer.copy()
-                    new_timer["id"] = self._get_next_timer_id()
-                    new_timer["elapsed_seconds"] = 0
-                    
-                    # For countdown timers, preserve the most recent countdown value from daily states
-                    # For stopwatch timers, reset countdown to 0
-                    if best_timer["type"] == "countdown" and best_date:
-                        # Get the most recent countdown value from daily states
-                        daily_state = self.get_daily_timer_state(best_timer["id"], best_date)
-                        recent_countdown = daily_state.get("countdown_seconds", best_timer.get("countdown_seconds", 0))
-                        initial_countdown = daily_state.get("initial_countdown_seconds", best_timer.get("initial_countdown_seconds", 0))
-                        new_timer["countdown_seconds"] = recent_countdown
-                        new_timer["initial_countdown_seconds"] = initial_countdown
-                        logger.debug(f"Propagating countdown timer '{fav_name}' with {recent_countdown} seconds (initial: {initial_countdown})")
-                    else:
-                        new_timer["countdown_seconds"] = 0
-                        new_timer["initial_countdown_seconds"] = 0
-                    
-                    new_timer["is_running"] = False
-                    new_timer["is_favorite"] = True  # Ensure favorite status is preserved
-                    # Keep original date_created but track where this instance was propagated to
-                    new_timer["propagated_to"] = date_str
-                    new_timer["created_at"] = datetime.now().isoformat()
-                    new_timer["last_started"] = None
-                    favorited_timers.append(new_timer)
-                    existing_names.add(fav_name)  # Prevent duplicates
+        # For each favorited name not on current date, propagate its best instance
+        created_at = datetime.now().isoformat()
+        for fav_name, (best_date, best_timer) in best_instances.items():
+            if fav_name in existing_names:
+                continue
+
+            # Create a new timer instance for this date with reset times
+            new_timer = best_timer.copy()
+            new_timer["id"] = self._get_next_timer_id()
+            new_timer["elapsed_seconds"] = 0
+            
+            # For countdown timers, preserve the most recent countdown value from daily states
+            # For stopwatch timers, reset countdown to 0
+            if best_timer["type"] == "countdown" and best_date:
+                # Get the most recent countdown value from daily states
+                daily_state = self.get_daily_timer_state(best_timer["id"], best_date)
+                recent_countdown = daily_state.get("countdown_seconds", best_timer.get("countdown_seconds", 0))
+                initial_countdown = daily_state.get("initial_countdown_seconds", best_timer.get("initial_countdown_seconds", 0))
+                new_timer["countdown_seconds"] = recent_countdown
+                new_timer["initial_countdown_seconds"] = initial_countdown
+                logger.debug(f"Propagating countdown timer '{fav_name}' with {recent_countdown} seconds (initial: {initial_countdown})")
+            else:
+                new_timer["countdown_seconds"] = 0
+                new_timer["initial_countdown_seconds"] = 0
+            
+            new_timer["is_running"] = False
+            new_timer["is_favorite"] = True  # Ensure favorite status is preserved
+            # Keep original date_created but track where this instance was propagated to
+            new_timer["propagated_to"] = date_str
+            new_timer["created_at"] = created_at
+            new_timer["last_started"] = None
+            favorited_timers.append(new_timer)
+            existing_names.add(fav_name)  # Prevent duplicates
         
         # Add favorited timers to this date's timer list
         if favorited_timers:
-            if date_str not in self.daily_timers["daily_timers"]:
-                self.daily_timers["daily_timers"][date_str] = []
-            self.daily_timers["daily_timers"][date_str].extend(favorited_timers)
+            daily_timers.setdefault(date_str, []).extend(
+                new_timer["id"] for new_timer in favorited_timers
+            )
             
             # Also add to global timers table for session compatibility
             self.data["timers"].extend(favorited_timers)
+            for new_timer in favorited_timers:
+                self._timers_by_id[new_timer["id"]] = new_timer
             
             # Create initial daily states for the newly propagated timers
             for new_timer in favorited_timers:
@@ -902,7 +1077,7 @@ class Database:
             self.save_daily_timers()
         
         # Return all timers for this date (existing + newly propagated favorites)
-        return self.daily_timers["daily_timers"].get(date_str, [])
+        return self._resolve_timers(daily_timers.get(date_str, []))
         
     def _find_most_recent_timer_date(self, target_date: str) -> Optional[str]:
         """DEPRECATED: No longer used since timers are date-independent."""
@@ -925,6 +1100,14 @@ class Database:
         if timer_type not in ("stopwatch", "countdown"):
             raise ValidationError("Timer type must be 'stopwatch' or 'countdown'")
         
+        # Check for duplicate names on this specific date only, before any
+        # global state is touched
+        date_timer_ids = self.daily_timers.setdefault("daily_timers", {}).setdefault(
+            date_str, []
+        )
+        if any(t["name"] == name for t in self._resolve_timers(date_timer_ids)):
+            raise ValidationError(f"Timer with name '{name}' already exists on {date_str}")
+
         # Create unique timer ID for this date
         timer_id = self._get_next_timer_id()
         
@@ -945,24 +1128,11 @@ class Database:
         
         # Add to global timers table (for sessions compatibility)
         self.data["timers"].append(timer_data)
+        self._timers_by_id[timer_id] = timer_data
         self.save_data()
         
         # Add to date-specific timers
-        if "daily_timers" not in self.daily_timers:
-            self.daily_timers["daily_timers"] = {}
-            
-        if date_str not in self.daily_timers["daily_timers"]:
-            self.daily_timers["daily_timers"][date_str] = []
-        
-        # Check for duplicate names on this specific date only
-        existing_names = [t["name"] for t in self.daily_timers["daily_timers"][date_str]]
-        if name in existing_names:
-            # Rollback the global timer that was added
-            self.data["timers"] = [t for t in self.data["timers"] if t["id"] != timer_id]
-            self.data["next_id"] -= 1  # Rollback ID counter
-            raise ValidationError(f"Timer with name '{name}' already exists on {date_str}")
-            
-        self.daily_timers["daily_timers"][date_str].append(timer_data.copy())
+        date_timer_ids.append(timer_id)
         self.save_daily_timers()
         
         # Add to timer order for this date (after favorites, before regular timers)
@@ -978,20 +1148,7 @@ class Database:
             # Find where favorites end and regular timers begin
             for i, existing_timer_id in enumerate(current_order):
                 # Get the existing timer to check if it's favorited
-                existing_timer = None
-                
-                # Check in daily_timers for this date
-                for timer in self.daily_timers.get("daily_timers", {}).get(date_str, []):
-                    if timer["id"] == existing_timer_id:
-                        existing_timer = timer
-                        break
-                
-                # If not found in daily timers, check global timers
-                if not existing_timer:
-                    for timer in self.data.get("timers", []):
-                        if timer["id"] == existing_timer_id:
-                            existing_timer = timer
-                            break
+                existing_timer = self._timers_by_id.get(existing_timer_id)
                 
                 # If we found a non-favorite timer, insert before it
                 if existing_timer and not existing_timer.get("is_favorite", False):
@@ -1041,38 +1198,29 @@ class Database:
         old_name = None
         is_favorite = False
         
-        if ("daily_timers" in self.daily_timers and 
-            date_str in self.daily_timers["daily_timers"]):
-            
-            for timer in self.daily_timers["daily_timers"][date_str]:
-                if timer["id"] == timer_id:
-                    old_name = timer["name"]
-                    is_favorite = timer.get("is_favorite", False)
-                    timer_found = True
-                    break
+        date_timers = self._resolve_timers(
+            self.daily_timers.get("daily_timers", {}).get(date_str, [])
+        )
+        for timer in date_timers:
+            if timer["id"] == timer_id:
+                old_name = timer["name"]
+                is_favorite = timer.get("is_favorite", False)
+                timer_found = True
+                break
         
         if not timer_found or old_name is None:
             raise ValidationError(f"Timer with ID {timer_id} not found on {date_str}")
         
         # Check for duplicate names on this date (excluding the timer being renamed)
-        if ("daily_timers" in self.daily_timers and 
-            date_str in self.daily_timers["daily_timers"]):
-            
-            for timer in self.daily_timers["daily_timers"][date_str]:
-                if timer["id"] != timer_id and timer["name"].lower() == new_name.lower():
-                    raise ValidationError(f"A timer with name '{new_name}' already exists on {date_str}")
+        for timer in date_timers:
+            if timer["id"] != timer_id and timer["name"].lower() == new_name.lower():
+                raise ValidationError(f"A timer with name '{new_name}' already exists on {date_str}")
         
         # If this is a favorited timer, update ALL instances of this timer name across ALL dates
         if is_favorite:
-            # Update all instances of this timer across all dates
-            for other_date, timers in self.daily_timers.get("daily_timers", {}).items():
-                for timer in timers:
-                    if timer["name"] == old_name:  # Match by old name to find all instances
-                        timer["name"] = new_name
-            
-            # Also update in global timers table
+            # Daily timers reference the global timers, so this covers all dates
             for timer in self.data["timers"]:
-                if timer["name"] == old_name:
+                if timer["name"] == old_name:  # Match by old name to find all instances
                     timer["name"] = new_name
                     
             # Also update any active sessions with this project name
@@ -1083,16 +1231,7 @@ class Database:
             logger.info(f"Favorited timer '{old_name}' renamed to '{new_name}' across all dates and active sessions")
         else:
             # Not favorited - only update this specific timer on this date
-            for timer in self.daily_timers["daily_timers"][date_str]:
-                if timer["id"] == timer_id:
-                    timer["name"] = new_name
-                    break
-            
-            # Update in global timers (for session compatibility)
-            for timer in self.data["timers"]:
-                if timer["id"] == timer_id:
-                    timer["name"] = new_name
-                    break
+            self._timers_by_id[timer_id]["name"] = new_name
                     
             # Also update any active sessions with this project name (even for non-favorited timers)
             for session in self.sessions.get("sessions", []):
@@ -1107,20 +1246,23 @@ class Database:
 
     def remove_timer_from_date(self, date_str: str, timer_id: int):
         """Remove a timer from a specific date."""
-        if (date_str in self.daily_timers.get("daily_timers", {}) and 
-            self.daily_timers["daily_timers"][date_str]):
-            
-            self.daily_timers["daily_timers"][date_str] = [
-                t for t in self.daily_timers["daily_timers"][date_str] 
-                if t["id"] != timer_id
+        daily_timers = self.daily_timers.get("daily_timers", {})
+        date_timer_ids = daily_timers.get(date_str)
+        if not date_timer_ids:
+            return
+
+        # Only rewrite and save the list if the timer is actually on it
+        if timer_id in date_timer_ids:
+            daily_timers[date_str] = [
+                tid for tid in date_timer_ids if tid != timer_id
             ]
             self.save_daily_timers()
-            
-            # Remove from timer order for this date
-            current_order = self.get_timer_order(date_str)
-            if timer_id in current_order:
-                current_order.remove(timer_id)
-                self.update_timer_order(date_str, current_order)
+
+        # Remove from timer order for this date
+        current_order = self.get_timer_order(date_str)
+        if timer_id in current_order:
+            current_order.remove(timer_id)
+            self.update_timer_order(date_str, current_order)
 
     def toggle_timer_favorite(self, date_str: str, timer_id: int) -> bool:
         """Toggle the favorite status of a timer with smart unfavorite logic.
@@ -1147,7 +1289,7 @@ class Database:
         new_status = False
         timer_name = None
         
-        for timer in self.daily_timers["daily_timers"][date_str]:
+        for timer in self._resolve_timers(self.daily_timers["daily_timers"][date_str]):
             if timer["id"] == timer_id:
                 timer["is_favorite"] = not timer.get("is_favorite", False)
                 new_status = timer["is_favorite"]
@@ -1158,15 +1300,10 @@ class Database:
         if not timer_found:
             raise ValidationError(f"Timer {timer_id} not found on date {date_str}")
         
-        # Update all instances of this timer across all dates
-        for other_date, timers in self.daily_timers.get("daily_timers", {}).items():
-            for timer in timers:
-                if timer["name"] == timer_name:  # Match by name since IDs are unique per date
-                    timer["is_favorite"] = new_status
-        
-        # Also update in global timers table
+        # Update all instances of this timer across all dates; daily timers
+        # reference the global timers, so updating those covers every date
         for timer in self.data["timers"]:
-            if timer["name"] == timer_name:
+            if timer["name"] == timer_name:  # Match by name since IDs are unique per date
                 timer["is_favorite"] = new_status
         
         # If unfavoriting, remove from dates where no time was tracked
@@ -1191,7 +1328,11 @@ class Database:
         
         # First, identify dates where this timer was originally created
         # (not propagated from somewhere else)
-        for date_str, timers in self.daily_timers.get("daily_timers", {}).items():
+        timers_by_date = {
+            date_str: self._resolve_timers(timer_ids)
+            for date_str, timer_ids in self.daily_timers.get("daily_timers", {}).items()
+        }
+        for date_str, timers in timers_by_date.items():
             for timer in timers:
                 if (timer["name"] == timer_name and 
                     timer.get("date_created") == date_str and
@@ -1201,7 +1342,7 @@ class Database:
         logger.debug(f"Cleanup for '{timer_name}': original dates = {original_dates}")
         
         # Check all dates that have this timer (not just ones with daily states)
-        for date_str, timers in self.daily_timers.get("daily_timers", {}).items():
+        for date_str, timers in timers_by_date.items():
             # Skip if this is an original creation date
             if date_str in original_dates:
                 continue
@@ -1237,23 +1378,30 @@ class Database:
                 dates_to_clean.append(date_str)
         
         # Remove timer from dates where it was propagated but no time was tracked
+        timers_by_id = self._timers_by_id
         for date_str in dates_to_clean:
-            # Remove from daily timers
-            original_count = len(self.daily_timers["daily_timers"][date_str])
-            self.daily_timers["daily_timers"][date_str] = [
-                timer for timer in self.daily_timers["daily_timers"][date_str]
-                if timer["name"] != timer_name
-            ]
-            removed_count = original_count - len(self.daily_timers["daily_timers"][date_str])
-            
-            # Also remove corresponding instances from global timers
-            # But only those that were propagated to this date
-            self.data["timers"] = [
-                timer for timer in self.data["timers"]
-                if not (timer["name"] == timer_name and timer.get("propagated_to") == date_str)
+            # Remove from daily timers; IDs with no global timer are kept as
+            # they are rather than dropped with the cleaned instances
+            timer_ids = self.daily_timers["daily_timers"][date_str]
+            kept_ids = [
+                timer_id for timer_id in timer_ids
+                if timer_id not in timers_by_id
+                or timers_by_id[timer_id]["name"] != timer_name
             ]
+            self.daily_timers["daily_timers"][date_str] = kept_ids
+            logger.debug(
+                f"Removed {len(timer_ids) - len(kept_ids)} '{timer_name}' "
+                f"instances from {date_str}"
+            )
         
         if dates_to_clean:
+            # Also remove corresponding instances from global timers
+            # But only those that were propagated to the cleaned dates
+            cleaned_dates = set(dates_to_clean)
+            self._set_timers([
+                timer for timer in self.data["timers"]
+                if not (timer["name"] == timer_name and timer.get("propagated_to") in cleaned_dates)
+            ])
             logger.info(f"Cleaned unfavorited timer '{timer_name}' from {len(dates_to_clean)} dates with no tracked time (preserving original creation dates)")
 
     def start_session(self, timer_id: int, project_name: str) -> int:
@@ -1278,15 +1426,17 @@ class Database:
         project_name = self._sanitize_project_name(project_name)
         
         # Generate unique session ID
-        existing_ids = [s.get("id", 0) for s in self.sessions.get("sessions", [])]
-        next_id = max(existing_ids) + 1 if existing_ids else 1
+        next_id = self.sessions["next_session_id"]
+        self.sessions["next_session_id"] = next_id + 1
         
+        # One clock read so the date always matches the start time
+        now = datetime.now()
         session = {
             "id": next_id,
             "timer_id": timer_id,
             "project_name": project_name,
-            "date": date.today().isoformat(),
-            "start_time": datetime.now().isoformat(),
+            "date": now.date().isoformat(),
+            "start_time": now.isoformat(),
             "end_time": None,
             "duration_seconds": 0,
             "is_active": True,
@@ -1296,6 +1446,8 @@ class Database:
             self.sessions["sessions"] = []
 
         self.sessions["sessions"].append(session)
+        self._sessions_by_id[next_id] = session
+        self._sessions_by_date[session["date"]].append(session)
         self.save_sessions()
         return session["id"]
 
@@ -1314,27 +1466,25 @@ class Database:
         """
         if not isinstance(session_id, int) or session_id <= 0:
             raise ValidationError("Session ID must be a positive integer")
-        """End a work session and return duration in seconds"""
-        for session in self.sessions.get("sessions", []):
-            if session["id"] == session_id and session["is_active"]:
-                session["end_time"] = datetime.now().isoformat()
-                session["is_active"] = False
-
-                # Calculate duration
-                try:
-                    start = datetime.fromisoformat(session["start_time"])
-                    end = datetime.fromisoformat(session["end_time"])
-                    duration = int((end - start).total_seconds())
-                except ValueError as e:
-                    logger.error(
-                        f"Invalid datetime format in session {session_id}: {e}"
-                    )
-                    raise DatabaseError(f"Invalid session timestamps: {e}") from e
-                session["duration_seconds"] = duration
-
-                self.save_sessions()
-                return duration
-        return 0
+        session = self._sessions_by_id.get(session_id)
+        if session is None or not session["is_active"]:
+            return 0
+
+        end = datetime.now()
+        session["end_time"] = end.isoformat()
+        session["is_active"] = False
+
+        # Calculate duration
+        try:
+            start = datetime.fromisoformat(session["start_time"])
+            duration = int((end - start).total_seconds())
+        except ValueError as e:
+            logger.error(f"Invalid datetime format in session {session_id}: {e}")
+            raise DatabaseError(f"Invalid session timestamps: {e}") from e
+        session["duration_seconds"] = duration
+
+        self.save_sessions()
+        return duration
 
     def get_daily_summary(self, target_date: str = None) -> Dict[str, int]:
         """Get project time summary for a specific date"""
@@ -1342,8 +1492,8 @@ class Database:
             target_date = date.today().isoformat()
 
         summary = {}
-        for session in self.sessions.get("sessions", []):
-            if session["date"] == target_date and not session["is_active"]:
+        for session in self._sessions_by_date.get(target_date, ()):
+            if not session["is_active"]:
                 project = session["project_name"]
                 duration = session["duration_seconds"]
 
@@ -1356,9 +1506,10 @@ class Database:
     def get_weekly_summary(self) -> Dict[str, Dict[str, int]]:
         """Get project time summary for the last 7 days"""
         weekly_data = {}
+        today = date.today()
 
         for i in range(7):
-            current_date = (date.today() - timedelta(days=i)).isoformat()
+            current_date = (today - timedelta(days=i)).isoformat()
             daily_summary = self.get_daily_summary(current_date)
             if daily_summary:  # Only include days with work
                 weekly_data[current_date] = daily_summary
@@ -1367,21 +1518,23 @@ class Database:
 
     def reset_all_data(self):
         """Reset all data to initial state"""
-        # Reset timers data
+        # Replace all in-memory state first, then write each file once
         self.data = {"timers": [], "next_id": 1}
-        self.save_data(immediate=True)
-
-        # Reset sessions data
-        self.sessions = {"sessions": []}
-        self.save_sessions(immediate=True)
-
-        # Reset daily states data
+        self._index_timers()
+        self.sessions = {"sessions": [], "next_session_id": 1}
+        self._index_sessions()
         self.daily_states = {"daily_states": {}}
-        self.save_daily_states(immediate=True)
-        
-        # Reset daily timers data
         self.daily_timers = {"daily_timers": {}}
-        self.save_daily_timers(immediate=True)
+
+        for data_type, data, file_path in (
+            ("data", self.data, self.db_file),
+            ("sessions", self.sessions, self.sessions_file),
+            ("daily_states", self.daily_states, self.daily_states_file),
+            ("daily_timers", self.daily_timers, self.daily_timers_file),
+        ):
+            self._save_data_to_file(data, file_path)
+            # Anything queued before the reset is now on disk as empty
+            self._pending_saves[data_type] = False
 
         # Remove stats file if it exists
         stats_file = "stats.json"
@@ -0,0 +1,54 @@
+"""Atomic file writes shared by the config and data managers."""
+
+import os
+from pathlib import Path
+
+# Flags for creating private files; O_BINARY avoids newline translation on Windows
+_PRIVATE_WRITE_FLAGS = (
+    os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+)
+
+
+def _write_new_file(path: Path, payload: bytes, durable: bool) -> None:
+    """Write payload to path, creating it readable by the owner only.
+
+    The mode is applied when the file is created, so it is never briefly
+    readable by others and needs no separate chmod. The payload goes out in
+    one write call unless the OS accepts only part of it.
+    """
+    fd = os.open(path, _PRIVATE_WRITE_FLAGS, 0o600)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+        if durable:
+            os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def write_private_file(path: Path, payload: bytes, durable: bool = False) -> None:
+    """Atomically replace path with payload, readable by the owner only.
+
+    The payload is written to a sibling temp file that is then renamed over
+    path, so a crash mid-write never leaves a truncated file behind. The
+    parent directory normally exists, so it is only created if the first
+    open finds it missing.
+
+    Args:
+        path: File to replace
+        payload: Bytes to write
+        durable: If True, fsync the temp file before renaming it so the data
+            survives a power loss; otherwise flushing is left to the OS
+
+    Raises:
+        OSError: If the file cannot be written or renamed
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        _write_new_file(tmp_path, payload, durable)
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _write_new_file(tmp_path, payload, durable)
+
+    os.replace(tmp_path, path)
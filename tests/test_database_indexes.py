@@ -0,0 +1,89 @@
+"""Tests that the database lookup indexes follow its timers and sessions."""
+
+import shutil
+import tempfile
+from datetime import date, timedelta
+from pathlib import Path
+
+from src.fathertime.database import Database
+
+
+class TestDatabaseIndexes:
+    """Test the id and date indexes after bulk changes."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.db = Database(data_dir=str(self.temp_dir))
+
+    def teardown_method(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _assert_indexes_match(self):
+        """Check the indexes against freshly built ones."""
+        timers = self.db.data["timers"]
+        sessions = self.db.sessions["sessions"]
+        assert self.db._timers_by_id == {timer["id"]: timer for timer in timers}
+        assert self.db._sessions_by_id == {s["id"]: s for s in sessions}
+        indexed = [s for group in self.db._sessions_by_date.values() for s in group]
+        assert sorted(s["id"] for s in indexed) == sorted(s["id"] for s in sessions)
+        for date_str, group in self.db._sessions_by_date.items():
+            assert all(session["date"] == date_str for session in group)
+
+    def test_indexes_after_reset(self):
+        """Resetting all data empties every index."""
+        timer_id = self.db.add_timer("Work", "stopwatch")
+        session_id = self.db.start_session(timer_id, "Project")
+        self.db.end_session(session_id)
+
+        self.db.reset_all_data()
+
+        self._assert_indexes_match()
+        assert self.db.get_timer(timer_id) is None
+        assert self.db.get_daily_summary() == {}
+        assert self.db.end_session(session_id) == 0
+
+    def test_indexes_after_archiving(self):
+        """Archived sessions drop out of the session indexes."""
+        timer_id = self.db.add_timer("Work", "stopwatch")
+        old_id = self.db.start_session(timer_id, "Old")
+        self.db.end_session(old_id)
+        new_id = self.db.start_session(timer_id, "New")
+        self.db.end_session(new_id)
+
+        old_date = (date.today() - timedelta(days=30)).isoformat()
+        self.db._sessions_by_id[old_id]["date"] = old_date
+        self.db._check_and_archive_old_data()
+
+        self._assert_indexes_match()
+        assert old_id not in self.db._sessions_by_id
+        assert self.db.get_daily_summary(old_date) == {}
+        assert set(self.db.get_daily_summary()) == {"New"}
+
+    def test_indexes_after_replacing_lists(self):
+        """Replacing the timers or sessions lists rebuilds their indexes."""
+        first = self.db.add_timer("First", "stopwatch")
+        second = self.db.add_timer("Second", "stopwatch")
+        kept_session = self.db.start_session(first, "Kept")
+        dropped_session = self.db.start_session(second, "Dropped")
+
+        self.db._set_timers([self.db.get_timer(first)])
+        self.db._set_sessions([self.db._sessions_by_id[kept_session]])
+
+        self._assert_indexes_match()
+        assert self.db.get_timer(second) is None
+        assert self.db.end_session(dropped_session) == 0
+
+    def test_indexes_after_reload(self):
+        """A database loaded from disk indexes the saved data."""
+        timer_id = self.db.add_timer("Work", "stopwatch")
+        session_id = self.db.start_session(timer_id, "Project")
+        self.db.flush_all_saves()
+
+        self.db = Database(data_dir=str(self.temp_dir))
+
+        self._assert_indexes_match()
+        assert self.db.get_timer(timer_id)["name"] == "Work"
+        assert self.db.end_session(session_id) >= 0
+        assert not self.db._sessions_by_id[session_id]["is_active"]
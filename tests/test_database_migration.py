@@ -0,0 +1,214 @@
+"""Tests for migrating legacy daily timer copies to timer ID references."""
+
+import json
+import shutil
+import tempfile
+from datetime import date, timedelta
+from pathlib import Path
+
+import pytest
+
+from src.fathertime.database import Database
+from src.fathertime.exceptions import DatabaseError
+
+
+# Recent dates, so startup archiving leaves the sessions in place
+DAY1, DAY2, DAY3 = (
+    (date.today() - timedelta(days=n)).isoformat() for n in (3, 2, 1)
+)
+
+
+def _timer(timer_id, name, is_favorite=False):
+    """Build a legacy timer entry."""
+    return {
+        "id": timer_id,
+        "name": name,
+        "type": "stopwatch",
+        "is_favorite": is_favorite,
+        "created_at": f"{DAY1}T09:00:00",
+    }
+
+
+class TestDailyTimerMigration:
+    """Test the one-time migration of per-date timer copies."""
+
+    def setup_method(self):
+        """Set up a data directory with legacy files."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self._write("data/timers.json", {"timers": [_timer(1, "Work")], "next_id": 2})
+        self._write("data/sessions.json", {
+            "sessions": [
+                {"id": 1, "timer_id": 1, "date": DAY1,
+                 "start_time": f"{DAY1}T09:00:00",
+                 "end_time": f"{DAY1}T10:00:00", "duration": 3600},
+                {"id": 2, "timer_id": 1, "date": DAY2,
+                 "start_time": f"{DAY2}T09:00:00",
+                 "end_time": f"{DAY2}T09:30:00", "duration": 1800},
+            ],
+            "next_session_id": 3,
+        })
+        self._write("daily_timers.json", {
+            "daily_timers": {
+                DAY1: [_timer(1, "Work")],
+                DAY2: [_timer(1, "Meetings")],
+                DAY3: [_timer(1, "Reading")],
+            }
+        })
+        self._write("daily_timer_states.json", {
+            "daily_states": {
+                DAY1: {"1": {"elapsed_time": 3600}},
+                DAY2: {"1": {"elapsed_time": 1800}},
+                DAY3: {"1": {"elapsed_time": 600}},
+            }
+        })
+        self._write("timer_order.json", {
+            "timer_order": {DAY2: [1], DAY3: [1]}
+        })
+
+    def teardown_method(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _write(self, name, data):
+        (self.temp_dir / name).parent.mkdir(parents=True, exist_ok=True)
+        (self.temp_dir / name).write_text(json.dumps(data), encoding="utf-8")
+
+    def _read(self, name):
+        return json.loads((self.temp_dir / name).read_text(encoding="utf-8"))
+
+    def test_shared_id_copies_get_their_own_ids(self):
+        """Copies sharing an ID across dates become separate timers."""
+        db = Database(data_dir=str(self.temp_dir))
+
+        names = {
+            date_str: [timer["name"] for timer in db.get_timers_for_date(date_str)]
+            for date_str in (DAY1, DAY2, DAY3)
+        }
+        assert names == {
+            DAY1: ["Work"],
+            DAY2: ["Meetings"],
+            DAY3: ["Reading"],
+        }
+
+        ids = [db.get_timers_for_date(d)[0]["id"]
+               for d in (DAY1, DAY2, DAY3)]
+        assert ids[0] == 1
+        assert len(set(ids)) == 3
+        assert db.data["next_id"] > max(ids)
+
+    def test_per_date_data_follows_the_new_id(self):
+        """States, order and sessions of a split date use the new ID."""
+        db = Database(data_dir=str(self.temp_dir))
+        new_id = db.get_timers_for_date(DAY2)[0]["id"]
+
+        state = db.get_daily_timer_state(new_id, DAY2)
+        assert state["elapsed_time"] == 1800
+        assert db.get_timer_order(DAY2) == [new_id]
+
+        sessions = {s["id"]: s["timer_id"] for s in db.sessions["sessions"]}
+        assert sessions == {1: 1, 2: new_id}
+
+        # The untouched first date keeps the original ID and data
+        assert db.get_daily_timer_state(1, DAY1)["elapsed_time"] == 3600
+
+    def test_migration_is_persisted(self):
+        """The rewritten files hold ID references and reload unchanged."""
+        Database(data_dir=str(self.temp_dir)).flush_all_saves()
+
+        daily_timers = self._read("daily_timers.json")["daily_timers"]
+        assert all(
+            isinstance(entry, int)
+            for entries in daily_timers.values()
+            for entry in entries
+        )
+
+        db = Database(data_dir=str(self.temp_dir))
+        assert db.get_timers_for_date(DAY3)[0]["name"] == "Reading"
+
+    def test_old_files_are_backed_up(self):
+        """The legacy files are copied before they are rewritten."""
+        original = (self.temp_dir / "daily_timers.json").read_bytes()
+        Database(data_dir=str(self.temp_dir)).flush_all_saves()
+
+        backup = self.temp_dir / "daily_timers.json.pre-migration.bak"
+        assert backup.read_bytes() == original
+        for name in ("data/timers.json", "data/sessions.json",
+                     "daily_timer_states.json", "timer_order.json"):
+            assert (self.temp_dir / f"{name}.pre-migration.bak").exists()
+
+    def test_non_favorite_rename_only_changes_one_date(self):
+        """Renaming a migrated non-favorite timer leaves other dates alone."""
+        db = Database(data_dir=str(self.temp_dir))
+        timer_id = db.get_timers_for_date(DAY2)[0]["id"]
+
+        db.rename_timer_on_date(DAY2, timer_id, "Standup")
+
+        assert db.get_timers_for_date(DAY1)[0]["name"] == "Work"
+        assert db.get_timers_for_date(DAY2)[0]["name"] == "Standup"
+        assert db.get_timers_for_date(DAY3)[0]["name"] == "Reading"
+
+    def test_orphan_ids_are_logged(self, caplog):
+        """Daily timer IDs with no global timer are logged once and skipped."""
+        self._write("daily_timers.json", {"daily_timers": {DAY1: [1, 99]}})
+        db = Database(data_dir=str(self.temp_dir))
+
+        with caplog.at_level("WARNING"):
+            timers = db.get_timers_for_date(DAY1)
+            db.get_timers_for_date(DAY1)
+
+        assert [timer["id"] for timer in timers] == [1]
+        warnings = [r for r in caplog.records if "unknown timer ID 99" in r.message]
+        assert len(warnings) == 1
+
+    def test_interrupted_migration_does_not_duplicate_timers(self, monkeypatch):
+        """A migration that stops before daily_timers is saved reruns cleanly."""
+        daily_timers_file = self.temp_dir / "daily_timers.json"
+        real_save = Database._save_data_to_file
+
+        def save_until_daily_timers(db, data, file_path, *args, **kwargs):
+            if file_path == daily_timers_file:
+                raise DatabaseError("simulated crash")
+            real_save(db, data, file_path, *args, **kwargs)
+
+        monkeypatch.setattr(Database, "_save_data_to_file", save_until_daily_timers)
+        with pytest.raises(DatabaseError):
+            Database(data_dir=str(self.temp_dir))
+        monkeypatch.undo()
+
+        # timers.json already holds the split-off timers, daily_timers the copies
+        assert len(self._read("data/timers.json")["timers"]) == 3
+        assert isinstance(self._read("daily_timers.json")["daily_timers"][DAY2][0], dict)
+
+        db = Database(data_dir=str(self.temp_dir))
+
+        assert len(db.data["timers"]) == 3
+        names = [db.get_timers_for_date(d)[0]["name"] for d in (DAY1, DAY2, DAY3)]
+        assert names == ["Work", "Meetings", "Reading"]
+        new_id = db.get_timers_for_date(DAY2)[0]["id"]
+        assert db.get_daily_timer_state(new_id, DAY2)["elapsed_time"] == 1800
+        assert {s["id"]: s["timer_id"] for s in db.sessions["sessions"]} == {
+            1: 1, 2: new_id
+        }
+
+    def test_migration_is_written_immediately(self):
+        """Migrated files are on disk without waiting for a batch save."""
+        db = Database(data_dir=str(self.temp_dir))
+
+        assert not any(db._pending_saves.values())
+        daily_timers = self._read("daily_timers.json")["daily_timers"]
+        assert daily_timers[DAY2] == [db.get_timers_for_date(DAY2)[0]["id"]]
+
+    def test_unfavorite_cleanup_keeps_orphan_ids(self):
+        """Cleaning up an unfavorited timer leaves unknown IDs in place."""
+        timer = dict(_timer(1, "Work", is_favorite=True), date_created=DAY1)
+        self._write("data/timers.json", {"timers": [timer], "next_id": 2})
+        self._write("daily_timers.json", {
+            "daily_timers": {DAY1: [1], DAY2: [1, 99]}
+        })
+        self._write("daily_timer_states.json", {"daily_states": {}})
+        db = Database(data_dir=str(self.temp_dir))
+
+        assert db.toggle_timer_favorite(DAY1, 1) is False
+
+        assert db.daily_timers["daily_timers"][DAY2] == [99]
+        assert db.daily_timers["daily_timers"][DAY1] == [1]
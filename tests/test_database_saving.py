@@ -0,0 +1,177 @@
+"""Tests for how the database batches and writes its files."""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pytest
+
+import src.fathertime.database as database_module
+from src.fathertime.database import Database
+
+
+def _wait_until(app, condition, timeout=2.0):
+    """Process Qt events until condition() is true or the timeout expires."""
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        app.processEvents()
+        time.sleep(0.01)
+    return condition()
+
+
+class TestBatchSaving:
+    """Test debounced saving while a Qt application is running."""
+
+    @pytest.fixture(autouse=True)
+    def setup_qt_app(self, monkeypatch):
+        """Set up a Qt application and a short batch interval."""
+        from PySide6.QtWidgets import QApplication
+
+        self.app = QApplication.instance() or QApplication(sys.argv)
+        monkeypatch.setattr(database_module, "BATCH_SAVE_INTERVAL", 50)
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.db = Database(data_dir=str(self.temp_dir))
+
+        yield
+
+        if self.db._batch_save_timer:
+            self.db._batch_save_timer.stop()
+        self.app.aboutToQuit.disconnect(self.db.flush_all_saves)
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_changes_are_saved_in_one_batch(self):
+        """Several changes start the timer once and are written together."""
+        size_before = self.db.db_file.stat().st_size
+
+        self.db.add_timer("First", "stopwatch")
+        self.db.add_timer("Second", "stopwatch")
+
+        assert self.db._batch_save_timer.isActive()
+        assert self.db._pending_saves["data"]
+        assert self.db.db_file.stat().st_size == size_before
+
+        assert _wait_until(self.app, lambda: not any(self.db._pending_saves.values()))
+        assert not self.db._batch_save_timer.isActive()
+        assert '"Second"' in self.db.db_file.read_text(encoding="utf-8")
+
+    def test_about_to_quit_flushes_pending_saves(self):
+        """Pending changes are written when the application quits."""
+        self.db.add_timer("Unsaved", "stopwatch")
+        self.db._batch_save_timer.stop()
+
+        self.app.aboutToQuit.emit()
+
+        assert not any(self.db._pending_saves.values())
+        assert '"Unsaved"' in self.db.db_file.read_text(encoding="utf-8")
+
+    def test_failed_save_rearms_timer(self, monkeypatch):
+        """A failed batch keeps its files pending and retries later."""
+        self.db.add_timer("Retry", "stopwatch")
+        self.db._batch_save_timer.stop()
+
+        def failing_save(*args, **kwargs):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(self.db, "_save_data_to_file", failing_save)
+        self.db._batch_save_all()
+
+        assert self.db._pending_saves["data"]
+        assert self.db._batch_save_timer.isActive()
+
+        monkeypatch.undo()
+        assert _wait_until(self.app, lambda: not self.db._pending_saves["data"])
+        assert '"Retry"' in self.db.db_file.read_text(encoding="utf-8")
+
+
+class TestImmediateSaving:
+    """Test saving when no Qt application is running."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+
+    def teardown_method(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_changes_are_saved_immediately(self, monkeypatch):
+        """Without an application to fire a timer, every save is written."""
+        monkeypatch.setattr(
+            database_module.QCoreApplication, "instance", staticmethod(lambda: None)
+        )
+        db = Database(data_dir=str(self.temp_dir))
+
+        assert db._batch_save_timer is None
+
+        db.add_timer("Immediate", "stopwatch")
+
+        assert not any(db._pending_saves.values())
+        assert '"Immediate"' in db.db_file.read_text(encoding="utf-8")
+
+
+class TestUnchangedSaveSkipping:
+    """Test that rewriting identical content is skipped."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.db = Database(data_dir=str(self.temp_dir))
+        self.file_path = self.temp_dir / "skip.json"
+        self.writes = []
+
+    def teardown_method(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _count_writes(self, monkeypatch):
+        """Record each file write and fsync the database makes."""
+        real_write_file = database_module.write_private_file
+        real_fsync = os.fsync
+        self.fsyncs = 0
+
+        def write_file(path, payload, durable=False):
+            self.writes.append(payload)
+            real_write_file(path, payload, durable)
+
+        def fsync(fd):
+            self.fsyncs += 1
+            real_fsync(fd)
+
+        monkeypatch.setattr(database_module, "write_private_file", write_file)
+        monkeypatch.setattr(os, "fsync", fsync)
+
+    def test_unchanged_payload_is_skipped(self, monkeypatch):
+        """Saving the same data twice writes the file once."""
+        self._count_writes(monkeypatch)
+
+        self.db._save_data_to_file({"value": 1}, self.file_path)
+        mtime = self.file_path.stat().st_mtime_ns
+        self.db._save_data_to_file({"value": 1}, self.file_path)
+
+        assert len(self.writes) == 1
+        assert self.file_path.stat().st_mtime_ns == mtime
+
+    def test_durable_save_writes_unchanged_payload(self, monkeypatch):
+        """A durable save writes and syncs even when nothing changed."""
+        self._count_writes(monkeypatch)
+
+        self.db._save_data_to_file({"value": 1}, self.file_path)
+        assert self.fsyncs == 0
+
+        self.db._save_data_to_file({"value": 1}, self.file_path, durable=True)
+
+        assert len(self.writes) == 2
+        assert self.fsyncs == 1
+
+    def test_changed_payload_is_written(self, monkeypatch):
+        """Saving different data always rewrites the file."""
+        self._count_writes(monkeypatch)
+
+        self.db._save_data_to_file({"value": 1}, self.file_path)
+        self.db._save_data_to_file({"value": 2}, self.file_path)
+
+        assert len(self.writes) == 2
+        assert '"value":2' in self.file_path.read_text(encoding="utf-8").replace(" ", "")
@@ -0,0 +1,66 @@
+"""Tests for the shared atomic file writer."""
+
+import os
+import shutil
+import stat
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from src.fathertime.fileio import write_private_file
+
+
+class TestWritePrivateFile:
+    """Test atomic, owner-only file writes."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.path = self.temp_dir / "data.json"
+
+    def teardown_method(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_replaces_file_without_leaving_temp_file(self):
+        """The new payload replaces the old one and the temp file is gone."""
+        self.path.write_bytes(b"old")
+
+        write_private_file(self.path, b"new")
+
+        assert self.path.read_bytes() == b"new"
+        assert list(self.temp_dir.iterdir()) == [self.path]
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX permissions")
+    def test_file_is_owner_only(self):
+        """The written file is readable and writable by the owner only."""
+        write_private_file(self.path, b"{}")
+
+        assert stat.S_IMODE(self.path.stat().st_mode) == 0o600
+
+    def test_creates_missing_parent_directory(self):
+        """A missing parent directory is created on the first write."""
+        path = self.temp_dir / "nested" / "data.json"
+
+        write_private_file(path, b"{}")
+
+        assert path.read_bytes() == b"{}"
+
+    def test_fsyncs_only_when_durable(self, monkeypatch):
+        """Only durable writes are synced to disk."""
+        real_fsync = os.fsync
+        synced = []
+
+        def fsync(fd):
+            synced.append(fd)
+            real_fsync(fd)
+
+        monkeypatch.setattr(os, "fsync", fsync)
+
+        write_private_file(self.path, b"1")
+        assert synced == []
+
+        write_private_file(self.path, b"2", durable=True)
+        assert len(synced) == 1
@@ -52,6 +52,14 @@ class TestConfigManagerSecurity:
             with pytest.raises(ConfigError, match="contains invalid characters|cannot be an absolute path"):
                 ConfigManager(config_file=dangerous_name, data_dir=str(self.temp_dir))
                 
+    def test_symlink_to_system_directory_rejected(self):
+        """Test that a symlink into a system directory is caught after resolving."""
+        link = self.temp_dir / "innocent"
+        link.symlink_to("/etc")
+
+        with pytest.raises(ConfigError, match="restricted system directory"):
+            ConfigManager(data_dir=str(link))
+
     def test_valid_config_paths_allowed(self):
         """Test that valid relative config paths are accepted."""
         valid_paths = [
@@ -78,6 +86,21 @@ class TestConfigManagerSecurity:
         assert config_file.exists()
         assert oct(config_file.stat().st_mode)[-3:] == '600'
 
+    def test_malformed_color_values_rejected(self):
+        """Test that colors must be exactly '#' followed by six hex digits."""
+        config_manager = ConfigManager(data_dir=str(self.temp_dir))
+
+        malformed_colors = [
+            "#ffff  ",   # Whitespace padding
+            "#0x0fff",   # Prefixed hex literal
+            "#ff_fff",   # Digit separator
+            "ff0000#",   # Misplaced hash
+        ]
+
+        for malformed_color in malformed_colors:
+            with pytest.raises(ConfigError):
+                config_manager.update_color("primary", malformed_color)
+
     def test_long_path_rejection(self):
         """Test that extremely long paths are rejected."""
         long_path = "a" * 300  # 300 characters